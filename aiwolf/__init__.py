@@ -2,7 +2,10 @@ from aiwolf.agent import Agent as Agent
 from aiwolf.agent import Role as Role
 from aiwolf.agent import Species as Species
 from aiwolf.agent import Status as Status
+from aiwolf.agentset import AgentSet as AgentSet
+from aiwolf.client import AsyncTcpipClient as AsyncTcpipClient
 from aiwolf.client import TcpipClient as TcpipClient
+from aiwolf.codec import Codec as Codec
 from aiwolf.constant import Constant as Constant
 from aiwolf.content import AgreeContentBuilder as AgreeContentBuilder
 from aiwolf.content import AndContentBuilder as AndContentBuilder
@@ -12,6 +15,7 @@ from aiwolf.content import BecauseContentBuilder as BecauseContentBuilder
 from aiwolf.content import ComingoutContentBuilder as ComingoutContentBuilder
 from aiwolf.content import Content as Content
 from aiwolf.content import ContentBuilder as ContentBuilder
+from aiwolf.content import ContentCache as ContentCache
 from aiwolf.content import DayContentBuilder as DayContentBuilder
 from aiwolf.content import DisagreeContentBuilder as DisagreeContentBuilder
 from aiwolf.content import DivinationContentBuilder as DivinationContentBuilder
@@ -33,11 +37,13 @@ from aiwolf.content import VoteContentBuilder as VoteContentBuilder
 from aiwolf.content import VotedContentBuilder as VotedContentBuilder
 from aiwolf.content import XorContentBuilder as XorContentBuilder
 from aiwolf.gameinfo import GameInfo as GameInfo
+from aiwolf.gameinfo import GameInfoDiff as GameInfoDiff
 from aiwolf.gamesetting import GameSetting as GameSetting
 from aiwolf.judge import Judge as Judge
 from aiwolf.player import AbstractPlayer as AbstractPlayer
 from aiwolf.utterance import Talk as Talk
 from aiwolf.utterance import Utterance as Utterance
+from aiwolf.utterance import UtteranceList as UtteranceList
 from aiwolf.utterance import UtteranceType as UtteranceType
 from aiwolf.utterance import Whisper as Whisper
 from aiwolf.vote import Vote as Vote
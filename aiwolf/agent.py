@@ -3,16 +3,30 @@ from __future__ import annotations
 
 import re
 from enum import Enum
-from typing import ClassVar, Dict, Match, Optional, Pattern
+from typing import ClassVar, Dict, List, Match, Optional, Pattern, Tuple
 
 class Agent:
-    """A player agent in AIWolf game."""
+    """A player agent in AIWolf game.
+
+    Agent is a flyweight: there is only one instance for each index number,
+    so Agents can be compared and hashed by identity.
+    """
+
+    __slots__ = ("_agent_idx", "_text")
+
+    _agent_table: ClassVar[List[Agent]] = []
+    """The Agents with the index numbers from 0 to 255, created in advance."""
 
     _agent_map: ClassVar[Dict[int, Agent]] = {}
+    """The Agents with the index numbers larger than 255, created on demand."""
+
+    _text_map: ClassVar[Dict[str, Agent]] = {}
+    """The Agents in _agent_table by their string forms, and AGENT_ANY by "ANY"."""
 
     _agent_pattern: ClassVar[Pattern[str]] = re.compile(r"(Agent\[(\d+)\]|ANY)")
 
     _agent_idx: int
+    _text: str
 
     @staticmethod
     def compile(input: str) -> Agent:
@@ -24,6 +38,9 @@ class Agent:
         Returns:
             The Agent converted from the given string.
         """
+        agent: Optional[Agent] = Agent._text_map.get(input)
+        if agent is not None:
+            return agent
         m: Optional[Match[str]] = Agent._agent_pattern.match(input)
         if m:
             if m.group(1) == "ANY":
@@ -33,28 +50,43 @@ class Agent:
         return Agent(0)
 
     def __new__(cls: type[Agent], idx: int) -> Agent:
-        if idx < 0:
-            raise ValueError("agent index must not be negative")
-        if idx in cls._agent_map.keys():
-            return cls._agent_map[idx]
-        cls._agent_map[idx] = super().__new__(cls)
-        return cls._agent_map[idx]
-
-    def __init__(self, idx: int) -> None:
-        """Initialize a new instance of Agent.
+        """Return the Agent with the given index number.
 
         Args:
             idx: The index number of the Agent.
         """
-        self._agent_idx = idx
+        if 0 <= idx < 256:
+            return cls._agent_table[idx]
+        if idx < 0:
+            raise ValueError("agent index must not be negative")
+        agent: Optional[Agent] = cls._agent_map.get(idx)
+        if agent is None:
+            agent = cls._agent_map[idx] = cls._new(idx)
+        return agent
+
+    @classmethod
+    def _new(cls: type[Agent], idx: int) -> Agent:
+        agent: Agent = super().__new__(cls)
+        agent._agent_idx = idx
+        agent._text = "Agent[" + "{:02}".format(idx) + "]"
+        return agent
 
     @property
     def agent_idx(self) -> int:
         """The index number of this Agent."""
         return self._agent_idx
 
+    def __reduce__(self) -> Tuple[type[Agent], Tuple[int]]:
+        # Unpickled through Agent(idx) so that the instances stay unique in the receiving process.
+        return (Agent, (self._agent_idx,))
+
     def __str__(self) -> str:
-        return "Agent[" + "{:02}".format(self.agent_idx) + "]"
+        return self._text
+
+
+Agent._agent_table = [Agent._new(i) for i in range(256)]
+Agent._text_map = {a._text: a for a in Agent._agent_table}
+Agent._text_map["ANY"] = Agent._agent_table[0xff]
 
 
 class Role(Enum):
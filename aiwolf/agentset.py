@@ -0,0 +1,148 @@
+"""agentset module."""
+from __future__ import annotations
+
+from typing import Iterable, Iterator, List
+
+from aiwolf.agent import Agent
+
+
+class AgentSet:
+    """Immutable set of Agents backed by a bitmask.
+
+    The bit i of the mask is set when Agent(i) is in the set, so membership tests
+    and set operations take a few integer operations regardless of the number of agents.
+    The Agents are iterated in ascending order of their index numbers.
+    """
+
+    __slots__ = ("_mask",)
+
+    _mask: int
+
+    def __init__(self, agents: Iterable[Agent] = ()) -> None:
+        """Initialize a new instance of AgentSet.
+
+        Args:
+            agents(optional): The Agents in the set. Defaults to ().
+        """
+        mask: int = 0
+        for a in agents:
+            mask |= 1 << a._agent_idx
+        self._mask = mask
+
+    @staticmethod
+    def from_mask(mask: int) -> AgentSet:
+        """Create an AgentSet from a bitmask.
+
+        Args:
+            mask: The bitmask whose bit i stands for Agent(i).
+
+        Returns:
+            The AgentSet represented by the given mask.
+        """
+        if mask < 0:
+            raise ValueError("mask must not be negative")
+        s: AgentSet = AgentSet.__new__(AgentSet)
+        s._mask = mask
+        return s
+
+    @staticmethod
+    def from_indices(indices: Iterable[int]) -> AgentSet:
+        """Create an AgentSet from the index numbers of the Agents.
+
+        Args:
+            indices: The index numbers of the Agents in the set.
+
+        Returns:
+            The AgentSet of the Agents with the given index numbers.
+        """
+        mask: int = 0
+        for i in indices:
+            mask |= 1 << i
+        return AgentSet.from_mask(mask)
+
+    @property
+    def mask(self) -> int:
+        """The bitmask whose bit i stands for Agent(i)."""
+        return self._mask
+
+    def __contains__(self, agent: object) -> bool:
+        try:
+            return (self._mask >> agent._agent_idx) & 1 == 1  # type: ignore
+        except AttributeError:
+            return False
+
+    def __iter__(self) -> Iterator[Agent]:
+        mask: int = self._mask
+        while mask:
+            low: int = mask & -mask
+            yield Agent(low.bit_length() - 1)
+            mask ^= low
+
+    def __len__(self) -> int:
+        return bin(self._mask).count("1")
+
+    def __bool__(self) -> bool:
+        return self._mask != 0
+
+    def __eq__(self, __o: object) -> bool:
+        if not isinstance(__o, AgentSet):
+            return NotImplemented
+        return self._mask == __o._mask
+
+    def __hash__(self) -> int:
+        return hash(self._mask)
+
+    def __or__(self, other: AgentSet) -> AgentSet:
+        return AgentSet.from_mask(self._mask | other._mask)
+
+    def __and__(self, other: AgentSet) -> AgentSet:
+        return AgentSet.from_mask(self._mask & other._mask)
+
+    def __sub__(self, other: AgentSet) -> AgentSet:
+        return AgentSet.from_mask(self._mask & ~other._mask)
+
+    def __xor__(self, other: AgentSet) -> AgentSet:
+        return AgentSet.from_mask(self._mask ^ other._mask)
+
+    def __repr__(self) -> str:
+        return "AgentSet([" + ", ".join(str(a) for a in self) + "])"
+
+    def union(self, other: AgentSet) -> AgentSet:
+        """Return the AgentSet of the Agents in this or the other."""
+        return self | other
+
+    def intersection(self, other: AgentSet) -> AgentSet:
+        """Return the AgentSet of the Agents in both this and the other."""
+        return self & other
+
+    def difference(self, other: AgentSet) -> AgentSet:
+        """Return the AgentSet of the Agents in this but not in the other."""
+        return self - other
+
+    def including(self, agent: Agent) -> AgentSet:
+        """Return the AgentSet with the given Agent added to this."""
+        s: AgentSet = AgentSet.__new__(AgentSet)
+        s._mask = self._mask | 1 << agent._agent_idx
+        return s
+
+    def excluding(self, agent: Agent) -> AgentSet:
+        """Return the AgentSet with the given Agent removed from this."""
+        s: AgentSet = AgentSet.__new__(AgentSet)
+        s._mask = self._mask & ~(1 << agent._agent_idx)
+        return s
+
+    def issubset(self, other: AgentSet) -> bool:
+        """Show whether or not every Agent in this is in the other."""
+        return self._mask & ~other._mask == 0
+
+    def filter(self, agents: Iterable[Agent]) -> List[Agent]:
+        """Return the Agents in the given iterable that are in this set, keeping their order.
+
+        Args:
+            agents: The Agents to be filtered.
+
+        Returns:
+            The list of the given Agents contained in this set.
+        """
+        mask: int = self._mask
+        return [a for a in agents if (mask >> a._agent_idx) & 1]
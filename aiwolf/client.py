@@ -1,12 +1,24 @@
 """client module."""
-import json
+from __future__ import annotations
+
+import asyncio
+import gzip
+import logging
+import selectors
 import socket
-from typing import List, Optional, TypedDict
+import threading
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from queue import SimpleQueue
+from typing import Callable, ClassVar, FrozenSet, Iterable, List, Optional, Tuple, TypedDict, Union
 
+from aiwolf.codec import Codec, encode_agent_idx, get_codec
 from aiwolf.gameinfo import GameInfo, _GameInfo
 from aiwolf.gamesetting import GameSetting, _GameSetting
 from aiwolf.player import AbstractPlayer
-from aiwolf.utterance import Talk, Whisper, _Utterance
+from aiwolf.utterance import Utterance, _Utterance
+
+logger: logging.Logger = logging.getLogger(__name__)
 
 
 class _Packet(TypedDict):
@@ -17,6 +29,112 @@ class _Packet(TypedDict):
     whisperHistory: Optional[List[_Utterance]]
 
 
+_Response = Optional[Union[str, bytes]]
+
+
+class _Worker:
+    """Single daemon thread running the submitted calls one at a time, in order.
+
+    Unlike the worker of a ThreadPoolExecutor, the thread is not joined at exit,
+    so a player stuck in a decision does not keep the process alive after the game.
+    """
+
+    _queue: SimpleQueue[Tuple[Future[_Response], Callable[[_Packet], _Response], _Packet]]
+
+    def __init__(self) -> None:
+        """Initialize a new instance of _Worker and start its thread."""
+        self._queue = SimpleQueue()
+        threading.Thread(target=self._run, name="aiwolf-player", daemon=True).start()
+
+    def submit(self, func: Callable[[_Packet], _Response], packet: _Packet) -> Future[_Response]:
+        """Schedule func(packet) to be run in the thread.
+
+        Args:
+            func: The function to be called.
+            packet: The argument of func.
+
+        Returns:
+            The Future of the result of func(packet).
+        """
+        future: Future[_Response] = Future()
+        self._queue.put((future, func, packet))
+        return future
+
+    def _run(self) -> None:
+        while True:
+            future, func, packet = self._queue.get()
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(func(packet))
+            except BaseException as e:
+                future.set_exception(e)
+
+
+class _LineFramer:
+    """Incremental splitter of the newline-delimited packet stream."""
+
+    _buffer: bytearray
+    _scanned: int
+
+    def __init__(self) -> None:
+        """Initialize a new instance of _LineFramer."""
+        self._buffer = bytearray()
+        self._scanned = 0
+
+    def feed(self, data: bytes) -> List[bytes]:
+        """Append the received bytes and return the frames completed by them.
+
+        Only the newly received bytes are scanned for newlines, and each frame is copied out exactly once.
+
+        Args:
+            data: The bytes received from the server.
+
+        Returns:
+            The list of complete frames, without their trailing newlines.
+        """
+        frames: List[bytes] = []
+        buffer: bytearray = self._buffer
+        if not buffer:
+            # Fast path: frames lying entirely in the new chunk are sliced from it directly.
+            start: int = 0
+            end: int = data.find(b"\n")
+            while end >= 0:
+                if end > start:
+                    frames.append(data[start:end])
+                start = end + 1
+                end = data.find(b"\n", start)
+            buffer += memoryview(data)[start:]
+            self._scanned = len(buffer)
+            return frames
+        buffer += data
+        start = 0
+        end = buffer.find(b"\n", self._scanned)
+        if end < 0:
+            self._scanned = len(buffer)
+            return frames
+        with memoryview(buffer) as view:
+            while end >= 0:
+                if end > start:
+                    frames.append(view[start:end].tobytes())
+                start = end + 1
+                end = buffer.find(b"\n", start)
+        del buffer[:start]
+        self._scanned = len(buffer)
+        return frames
+
+    def flush(self) -> bytes:
+        """Return and discard the bytes of the unterminated last frame.
+
+        Returns:
+            The bytes received after the last newline.
+        """
+        rest: bytes = bytes(self._buffer)
+        self._buffer.clear()
+        self._scanned = 0
+        return rest
+
+
 class TcpipClient:
     """Client agent that communiates with the server via TCP/IP connection."""
 
@@ -27,9 +145,26 @@ class TcpipClient:
     request_role: str
     game_info: Optional[GameInfo]
     last_game_info: Optional[GameInfo]
+    game_setting: Optional[GameSetting]
     sock: Optional[socket.socket]
+    wait_time_limits: Optional[float]
+    codec: Codec
+    time_budget: Optional[float]
+    missed_deadlines: int
+    """The number of decisions answered with the fallback because the player ran out of time."""
+    record_path: Optional[str]
+    record_seed: Optional[int]
+
+    _recorder: Optional[gzip.GzipFile]
+
+    _worker: ClassVar[Optional[_Worker]] = None
+
+    _decisions: ClassVar[FrozenSet[str]] = frozenset(["VOTE", "ATTACK", "GUARD", "DIVINE", "TALK", "WHISPER"])
 
-    def __init__(self, player: AbstractPlayer, name: Optional[str], host: str, port: int, request_role: str) -> None:
+    def __init__(self, player: AbstractPlayer, name: Optional[str], host: str, port: int, request_role: str,
+                 *, wait_time_limits: Optional[float] = None, codec: Optional[Codec] = None,
+                 time_budget: Optional[float] = None, record_path: Optional[str] = None,
+                 record_seed: Optional[int] = None) -> None:
         """Initialize a new instance of TcpipClient.
 
         Args:
@@ -38,6 +173,20 @@ class TcpipClient:
             host: The hostname of the server.
             port: The port number the server is waiting on.
             request_role: The name of role that the player agent wants to be.
+            wait_time_limits(optional): The longest wait for the next packet, in multiples of GameSetting.time_limit.
+                If the server stays silent longer than that, a warning is logged and the client closes the connection,
+                quitting the rest of the game. In a large game the server may stay silent for several time limits
+                while the other agents answer, so leave room for that. Defaults to None (wait forever).
+            codec(optional): The JSON codec for the packets. Defaults to None (the fastest one available).
+            time_budget(optional): The share of GameSetting.time_limit the player may spend on a decision.
+                When it runs out, a fallback answer is sent instead. Defaults to None (no deadline).
+                Once a client of the process has a deadline, every packet of every client in the process
+                is handled in one shared daemon thread, so a decision still running after its deadline
+                delays the following packets, and a player that never returns is abandoned at exit.
+            record_path(optional): The gzip file to record the received packets and the responses in,
+                for aiwolf.replay. Defaults to None (no recording).
+            record_seed(optional): The seed random was given before the game, stored in the record
+                so that the replay makes the same random choices. Defaults to None (not stored).
         """
         self.player = player
         self.name = name
@@ -46,52 +195,121 @@ class TcpipClient:
         self.request_role = request_role
         self.game_info = None
         self.last_game_info = None
+        self.game_setting = None
         self.sock = None
+        self.wait_time_limits = wait_time_limits
+        self.codec = codec if codec is not None else get_codec()
+        self.time_budget = time_budget
+        self.missed_deadlines = 0
+        self.record_path = record_path
+        self.record_seed = record_seed
+        self._recorder = None
+
+    @staticmethod
+    def _encode_response(response: Optional[Union[str, bytes]]) -> Optional[bytes]:
+        if isinstance(response, bytes):
+            return response + b"\n"
+        if isinstance(response, str):
+            return (response + "\n").encode("utf-8")
+        return None
+
+    def _handle_frame(self, frame: bytes) -> Optional[bytes]:
+        self._record_packet(frame)
+        return self._record_response(TcpipClient._encode_response(self._get_response(self.codec.loads(frame))))
+
+    def _record_packet(self, frame: bytes) -> None:
+        # A record is the raw packet line, followed by the response line prefixed with ">" if any.
+        # The packet is written before being handled, so that the one making the player fail is recorded too.
+        if self._recorder is not None:
+            self._recorder.write(frame + b"\n")
 
-    def _send_response(self, response: Optional[str]) -> None:
-        if isinstance(self.sock, socket.socket) and isinstance(response, str):
-            self.sock.send((response + "\n").encode("utf-8"))
+    def _record_response(self, data: Optional[bytes]) -> Optional[bytes]:
+        if self._recorder is not None and data is not None:
+            self._recorder.write(b">" + data)
+        return data
 
-    def _get_response(self, packet: _Packet) -> Optional[str]:
+    def _open_recorder(self) -> None:
+        if self.record_path is not None:
+            recorder: gzip.GzipFile = gzip.open(self.record_path, "wb")
+            if self.record_seed is not None:
+                # Header lines start with "#".
+                recorder.write(b"#seed " + str(self.record_seed).encode() + b"\n")
+            self._recorder = recorder
+
+    def _close_recorder(self) -> None:
+        if self._recorder is not None:
+            self._recorder.close()
+            self._recorder = None
+
+    def _get_deadline(self) -> Optional[float]:
+        if self.time_budget is None or self.game_setting is None or self.game_setting.time_limit <= 0:
+            return None
+        return self.game_setting.time_limit * self.time_budget / 1000
+
+    def _get_fallback(self, request: str) -> Union[str, bytes]:
+        if request == "TALK" or request == "WHISPER":
+            return Utterance.SKIP
+        return encode_agent_idx(self.player.get_vote_candidate().agent_idx)
+
+    @staticmethod
+    def _get_worker() -> _Worker:
+        # The players run in one worker thread shared by all the clients in the process, so that a decision
+        # overrunning its deadline never runs at the same time as other player code: the players,
+        # Content.cache and the other module-level state are not thread-safe.
+        if TcpipClient._worker is None:
+            TcpipClient._worker = _Worker()
+        return TcpipClient._worker
+
+    def _missed_deadline(self, request: str, fallback: Union[str, bytes]) -> Union[str, bytes]:
+        self.missed_deadlines += 1
+        logger.warning("%s missed the deadline of %s (%d missed so far)", self.name, request, self.missed_deadlines)
+        return fallback
+
+    def _get_response(self, packet: _Packet) -> Optional[Union[str, bytes]]:
+        deadline: Optional[float] = self._get_deadline()
+        if deadline is None and TcpipClient._worker is None:
+            return self._dispatch(packet)
+        worker: _Worker = TcpipClient._get_worker()
+        request: str = packet["request"]
+        if deadline is None or request not in TcpipClient._decisions:
+            return worker.submit(self._dispatch, packet).result()
+        # Prepared before submitting, as the worker may rewrite the vote candidate.
+        fallback: Union[str, bytes] = self._get_fallback(request)
+        future: Future[Optional[Union[str, bytes]]] = worker.submit(self._dispatch, packet)
+        try:
+            return future.result(timeout=deadline)
+        except FutureTimeoutError:
+            return self._missed_deadline(request, fallback)
+
+    def _dispatch(self, packet: _Packet) -> Optional[Union[str, bytes]]:
         request: str = packet["request"]
         if request == "NAME":
             return self.name if self.name is not None else self.player.get_name()
         elif request == "ROLE":
             return self.request_role
         game_info0: Optional[_GameInfo] = packet["gameInfo"]
-        self.game_info = GameInfo(game_info0) if game_info0 is not None else None
-        if self.game_info is None:
+        if game_info0 is None:
             self.game_info = self.last_game_info
+            if self.game_info is not None:
+                self.game_info.start_diff()
+        elif request == "INITIALIZE" or self.game_info is None:
+            self.game_info = GameInfo(game_info0)
         else:
-            self.last_game_info = self.game_info
+            self.game_info.merge(game_info0)
+        self.last_game_info = self.game_info
         if self.game_info is None:
             return None
         talk_history0: Optional[List[_Utterance]] = packet["talkHistory"]
         if talk_history0 is not None:
-            for talk0 in talk_history0:
-                talk: Talk = Talk.compile(talk0)
-                talk_list: List[Talk] = self.game_info.talk_list
-                if len(talk_list) == 0:
-                    talk_list.append(talk)
-                else:
-                    last_talk: Talk = talk_list[-1]
-                    if talk.day > last_talk.day or (talk.day == last_talk.day and talk.idx > last_talk.idx):
-                        talk_list.append(talk)
+            self.game_info.merge_talk_history(talk_history0)
         whisper_history0: Optional[List[_Utterance]] = packet["whisperHistory"]
         if whisper_history0 is not None:
-            for whisper0 in whisper_history0:
-                whisper: Whisper = Whisper.compile(whisper0)
-                whisper_list: List[Whisper] = self.game_info.whisper_list
-                if len(whisper_list) == 0:
-                    whisper_list.append(whisper)
-                else:
-                    last_whisper: Whisper = whisper_list[-1]
-                    if whisper.day > last_whisper.day or (whisper.day == last_whisper.day and whisper.idx > last_whisper.idx):
-                        whisper_list.append(whisper)
+            self.game_info.merge_whisper_history(whisper_history0)
         if request == "INITIALIZE":
             game_setting0: Optional[_GameSetting] = packet["gameSetting"]
             if game_setting0 is not None:
-                self.player.initialize(self.game_info, GameSetting(game_setting0))
+                self.game_setting = GameSetting(game_setting0)
+                self.player.initialize(self.game_info, self.game_setting)
             return None
         else:
             self.player.update(self.game_info)
@@ -104,41 +322,146 @@ class TcpipClient:
                 self.player.finish()
                 return None
             elif request == "VOTE":
-                return json.dumps({"agentIdx": self.player.vote().agent_idx}, separators=(",", ":"))
+                return encode_agent_idx(self.player.vote().agent_idx)
             elif request == "ATTACK":
-                return json.dumps({"agentIdx": self.player.attack().agent_idx}, separators=(",", ":"))
+                return encode_agent_idx(self.player.attack().agent_idx)
             elif request == "GUARD":
-                return json.dumps({"agentIdx": self.player.guard().agent_idx}, separators=(",", ":"))
+                return encode_agent_idx(self.player.guard().agent_idx)
             elif request == "DIVINE":
-                return json.dumps({"agentIdx": self.player.divine().agent_idx}, separators=(",", ":"))
+                return encode_agent_idx(self.player.divine().agent_idx)
             elif request == "TALK":
                 return self.player.talk().text
             elif request == "WHISPER":
                 return self.player.whisper().text
             return None
 
+    def _wait_timeout(self) -> Optional[float]:
+        if self.wait_time_limits is None or self.game_setting is None or self.game_setting.time_limit <= 0:
+            return None
+        return self.game_setting.time_limit * self.wait_time_limits / 1000
+
+    def _warn_silent(self, timeout: Optional[float]) -> None:
+        logger.warning("%s quits the game: no packet from the server for %.1f s", self.name, timeout or 0.0)
+
     def connect(self) -> None:
-        """Connect to the server."""
+        """Connect to the server.
+
+        The loop sleeps in the selector until the server sends data, instead of polling the socket.
+        Packets are delimited by newlines and decoded only once they are complete.
+        """
         self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        self.sock.settimeout(0.001)
         self.sock.connect((self.host, self.port))
-        line: str = ""
-        while True:
-            try:
-                line += self.sock.recv(8192).decode("utf-8")
-                if line == "":
+        selector: selectors.BaseSelector = selectors.DefaultSelector()
+        selector.register(self.sock, selectors.EVENT_READ)
+        framer: _LineFramer = _LineFramer()
+        self._open_recorder()
+        try:
+            while True:
+                timeout: Optional[float] = self._wait_timeout()
+                if not selector.select(timeout):
+                    self._warn_silent(timeout)
                     break
-            except socket.timeout:
-                pass
-            line_list: List[str] = line.split("\n", 1)
-            for i in range(len(line_list) - 1):
-                if len(line_list[i]) > 0:
-                    self._send_response(self._get_response(json.loads(line_list[i])))
-                line = line_list[-1]
-            try:
-                self._send_response(self._get_response(json.loads(line)))
-                line = ""
-            except ValueError:
-                pass
-        self.sock.close()
+                received: bytes = self.sock.recv(8192)
+                if not received:
+                    break
+                for frame in framer.feed(received):
+                    data: Optional[bytes] = self._handle_frame(frame)
+                    if data is not None:
+                        self.sock.sendall(data)
+            rest: bytes = framer.flush()
+            if rest.strip():
+                # The server closed the connection after a packet without a trailing newline.
+                self._handle_frame(rest)
+        finally:
+            self._close_recorder()
+            selector.close()
+            self.sock.close()
         return None
+
+
+class AsyncTcpipClient(TcpipClient):
+    """Client agent that communicates with the server via TCP/IP connection inside an asyncio event loop.
+
+    Many instances can share one event loop, each one driving its own player over its own connection.
+    Without a time_budget, the players are called synchronously, so a slow player delays the others in the same loop.
+    With one, the loop awaits the shared worker thread instead, so the other clients keep answering with
+    their fallbacks while a player overruns its deadline.
+    """
+
+    async def _get_response_async(self, packet: _Packet) -> Optional[Union[str, bytes]]:
+        deadline: Optional[float] = self._get_deadline()
+        if deadline is None and TcpipClient._worker is None:
+            return self._dispatch(packet)
+        worker: _Worker = TcpipClient._get_worker()
+        request: str = packet["request"]
+        if deadline is None or request not in TcpipClient._decisions:
+            return await asyncio.wrap_future(worker.submit(self._dispatch, packet))
+        fallback: Union[str, bytes] = self._get_fallback(request)
+        future: Future[Optional[Union[str, bytes]]] = worker.submit(self._dispatch, packet)
+        try:
+            # Shielded, so that the timeout does not cancel a packet still waiting for the worker.
+            return await asyncio.wait_for(asyncio.shield(asyncio.wrap_future(future)), deadline)
+        except asyncio.TimeoutError:
+            return self._missed_deadline(request, fallback)
+
+    async def _handle_frame_async(self, frame: bytes) -> Optional[bytes]:
+        self._record_packet(frame)
+        response: Optional[Union[str, bytes]] = await self._get_response_async(self.codec.loads(frame))
+        return self._record_response(TcpipClient._encode_response(response))
+
+    async def connect_async(self) -> None:
+        """Connect to the server and serve the requests until the server closes the connection."""
+        reader: asyncio.StreamReader
+        writer: asyncio.StreamWriter
+        reader, writer = await asyncio.open_connection(self.host, self.port)
+        framer: _LineFramer = _LineFramer()
+        self._open_recorder()
+        try:
+            while True:
+                timeout: Optional[float] = self._wait_timeout()
+                try:
+                    received: bytes = await asyncio.wait_for(reader.read(8192), timeout)
+                except asyncio.TimeoutError:
+                    self._warn_silent(timeout)
+                    break
+                if not received:
+                    break
+                for frame in framer.feed(received):
+                    data: Optional[bytes] = await self._handle_frame_async(frame)
+                    if data is not None:
+                        writer.write(data)
+                        await writer.drain()
+            rest: bytes = framer.flush()
+            if rest.strip():
+                await self._handle_frame_async(rest)
+        finally:
+            self._close_recorder()
+            writer.close()
+        await writer.wait_closed()
+        return None
+
+    def connect(self) -> None:
+        """Connect to the server in a new event loop."""
+        asyncio.run(self.connect_async())
+
+    @staticmethod
+    def run_all(clients: Iterable[AsyncTcpipClient]) -> None:
+        """Run the clients concurrently in one event loop until all of them are disconnected.
+
+        A client whose player raises an exception is disconnected and the error is logged,
+        while the other clients keep playing, as if each player ran in its own process.
+
+        Args:
+            clients: The clients to be run.
+        """
+        client_list: List[AsyncTcpipClient] = list(clients)
+
+        async def run() -> None:
+            results: List[Optional[BaseException]] = await asyncio.gather(*[client.connect_async() for client in client_list],
+                                                                          return_exceptions=True)
+            for client, result in zip(client_list, results):
+                if isinstance(result, Exception):
+                    logger.error("%s stopped with an error", client.name, exc_info=result)
+                elif isinstance(result, BaseException):
+                    raise result
+        asyncio.run(run())
@@ -0,0 +1,91 @@
+"""codec module."""
+from __future__ import annotations
+
+import json
+from typing import Any, Final, List, Optional, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
+
+class Codec:
+    """JSON codec for the packets exchanged with the server, based on the standard json module."""
+
+    name: str = "json"
+    """The name of the underlying JSON library."""
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """Decode a JSON document.
+
+        Args:
+            data: The JSON document to be decoded.
+
+        Returns:
+            The decoded object.
+        """
+        return json.loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        """Encode an object into a compact JSON document.
+
+        Args:
+            obj: The object to be encoded.
+
+        Returns:
+            The UTF-8 encoded JSON document.
+        """
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+class OrjsonCodec(Codec):
+    """JSON codec based on orjson."""
+
+    name: str = "orjson"
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """Decode a JSON document with orjson."""
+        return orjson.loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        """Encode an object into a compact JSON document with orjson."""
+        return orjson.dumps(obj)
+
+
+def get_codec(name: Optional[str] = None) -> Codec:
+    """Return the codec of the given name, or the fastest one available.
+
+    Args:
+        name(optional): The name of the codec, "json" or "orjson". Defaults to None (the fastest available).
+
+    Returns:
+        The Codec.
+
+    Raises:
+        ValueError: In case the named codec is not available, ValueError is raised.
+    """
+    if name is None:
+        return OrjsonCodec() if orjson is not None else Codec()
+    if name == "json":
+        return Codec()
+    if name == "orjson" and orjson is not None:
+        return OrjsonCodec()
+    raise ValueError("Codec " + name + " is not available")
+
+
+_AGENT_IDX_RESPONSES: Final[List[bytes]] = [('{"agentIdx":' + str(i) + '}').encode("utf-8") for i in range(0x100)]
+
+
+def encode_agent_idx(idx: int) -> bytes:
+    """Return the answer to VOTE/ATTACK/GUARD/DIVINE naming the given agent.
+
+    Args:
+        idx: The index number of the agent.
+
+    Returns:
+        The encoded {"agentIdx":idx} document, taken from a precomputed table.
+    """
+    if 0 <= idx < 0x100:
+        return _AGENT_IDX_RESPONSES[idx]
+    return ('{"agentIdx":' + str(idx) + '}').encode("utf-8")
@@ -1,18 +1,116 @@
 """content module."""
 from __future__ import annotations
 
-import copy
-import re
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from enum import Enum
-from typing import ClassVar, List, Match, Optional, Pattern
+from typing import TYPE_CHECKING, Any, Callable, ClassVar, Dict, Final, FrozenSet, Iterable, List, Optional, Tuple
 
 from aiwolf.agent import Agent, Role, Species
 from aiwolf.constant import AGENT_ANY, AGENT_NONE, AGENT_UNSPEC
 from aiwolf.utterance import Talk, Utterance, UtteranceType, Whisper
 
+if TYPE_CHECKING:
+    import numpy
+
+
+class ContentCache:
+    """Bounded LRU cache of the Contents compiled from uttered texts.
+
+    The cached Contents are immutable, so they are handed out as they are.
+    """
+
+    maxsize: int
+    """The largest number of the cached Contents. 0 disables the cache."""
+    hits: int
+    """The number of the lookups that found the text."""
+    misses: int
+    """The number of the lookups that did not find the text."""
+
+    _entries: OrderedDict[str, Content]
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        """Initialize a new instance of ContentCache.
+
+        Args:
+            maxsize(optional): The largest number of the cached Contents. Defaults to 1024.
+        """
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, text: str) -> Optional[Content]:
+        """Look up the Content compiled from the text, marking it as the most recently used.
+
+        Args:
+            text: The uttered text.
+
+        Returns:
+            The cached Content, or None if the text is not cached.
+        """
+        content: Optional[Content] = self._entries.get(text)
+        if content is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(text)
+        return content
+
+    def put(self, text: str, content: Content) -> None:
+        """Cache the Content compiled from the text, evicting the least recently used one if full.
+
+        Args:
+            text: The uttered text.
+            content: The Content compiled from the text.
+        """
+        if self.maxsize <= 0:
+            return
+        self._entries[text] = content
+        self._entries.move_to_end(text)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def resize(self, maxsize: int) -> None:
+        """Change the largest number of the cached Contents, evicting the least recently used ones if needed.
+
+        Args:
+            maxsize: The new largest number of the cached Contents.
+        """
+        self.maxsize = maxsize
+        while len(self._entries) > max(maxsize, 0):
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Discard all the cached Contents and reset the counters."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """The ratio of the lookups that found the text."""
+        lookups: int = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
 
 class Content:
-    """Content class expressing the content of an utterance."""
+    """Content class expressing the content of an utterance.
+
+    Content is immutable. The operands are shared between Contents instead of being copied,
+    and the normalized text is computed only once.
+    The operands of a compiled Content are parsed when content_list or text is first read.
+    The referred utterance is kept private and handed out as a copy, as Utterance is mutable.
+    """
+
+    __slots__ = ("topic", "subject", "target", "role", "result", "_utterance", "operator", "day",
+                 "_content_list", "_operands", "_text")
+
+    cache: ClassVar[ContentCache] = ContentCache()
+    """The cache used by compile."""
 
     topic: Topic
     """The topic of this Content."""
@@ -24,16 +122,15 @@ class Content:
     """The role this Content refers to."""
     result: Species
     """The species this Content refers to."""
-    utterance: Utterance
-    """The utterance this Content refers to."""
     operator: Operator
     """The operator in this Content."""
-    content_list: List[Content]
-    """The list of the operands in this Content."""
     day: int
     """The date added to the operand in this Content."""
-    text: str
-    """The text representing this Content."""
+
+    _utterance: Utterance
+    _content_list: Tuple[Content, ...]
+    _operands: Optional[str]
+    _text: Optional[str]
 
     @staticmethod
     def _get_contents(input: str) -> List[Content]:
@@ -62,177 +159,315 @@ class Content:
         Args:
             builder: A ContentBuilder used for initialization.
         """
-        self.topic = builder._topic
-        self.subject = builder._subject
-        self.target = builder._target
-        self.role = builder._role
-        self.result = builder._result
-        self.utterance = builder._utterance
-        self.operator = builder._operator
-        self.content_list = builder._content_list
-        self.day = builder._day
-        self.text = ""
-        self._complete_inner_subject()
-        self._normalize_text()
-
-    def _complete_inner_subject(self) -> None:
-        if not self.content_list:
-            return
-        self.content_list = [self._process_inner_content(c) for c in self.content_list]
+        self._init(builder._topic, builder._subject, builder._target, builder._role, builder._result,
+                   Content._copy_utterance(builder._utterance), builder._operator, builder._content_list, None, builder._day, None)
+
+    def _init(self, topic: Topic, subject: Agent, target: Agent, role: Role, result: Species, utterance: Utterance,
+              operator: Operator, content_list: Iterable[Content], operands: Optional[str], day: int, text: Optional[str]) -> None:
+        # Either content_list or operands, the unparsed text of the operands, is given.
+        # text is None until the normalized text is first needed.
+        # utterance is owned by this Content, so it must not be reachable from outside.
+        setattr: Callable[[object, str, Any], None] = object.__setattr__
+        setattr(self, "topic", topic)
+        setattr(self, "subject", subject)
+        setattr(self, "target", target)
+        setattr(self, "role", role)
+        setattr(self, "result", result)
+        setattr(self, "_utterance", utterance)
+        setattr(self, "operator", operator)
+        setattr(self, "day", day)
+        setattr(self, "_operands", operands)
+        setattr(self, "_content_list", tuple([self._process_inner_content(c) for c in content_list])
+                if operands is None and content_list else ())
+        setattr(self, "_text", text)
+
+    @property
+    def content_list(self) -> Tuple[Content, ...]:
+        """The operands in this Content."""
+        if self._operands is not None:
+            operands: List[Content] = Content._get_contents(self._operands)
+            object.__setattr__(self, "_content_list", tuple([self._process_inner_content(c) for c in operands]))
+            object.__setattr__(self, "_operands", None)
+        return self._content_list
+
+    @property
+    def utterance(self) -> Utterance:
+        """The utterance this Content refers to.
+
+        A copy is returned, so modifying it does not affect this Content.
+        """
+        return Content._copy_utterance(self._utterance)
+
+    @staticmethod
+    def _copy_utterance(utterance: Utterance) -> Utterance:
+        return type(utterance)(utterance.day, utterance.agent, utterance.idx, utterance.text, utterance.turn)
+
+    @property
+    def text(self) -> str:
+        """The text representing this Content."""
+        text: Optional[str] = self._text
+        if text is None:
+            text = self._get_text()
+            object.__setattr__(self, "_text", text)
+        return text
+
+    @staticmethod
+    def _create(topic: Topic, subject: Agent = AGENT_UNSPEC, target: Agent = AGENT_ANY, role: Role = Role.UNC,
+                result: Species = Species.UNC, utterance: Optional[Utterance] = None, operator: Optional[Operator] = None,
+                content_list: Iterable[Content] = (), operands: Optional[str] = None, day: int = -1,
+                text: Optional[str] = None) -> Content:
+        content: Content = Content.__new__(Content)
+        content._init(topic, subject, target, role, result, utterance if utterance is not None else Utterance(),
+                      operator if operator is not None else Operator.NOP, content_list, operands, day, text)
+        return content
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("Content is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError("Content is immutable")
+
+    def __copy__(self) -> Content:
+        return self
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> Content:
+        return self
+
+    def __reduce__(self) -> Tuple[Callable[..., Content], Tuple[Any, ...]]:
+        # The unparsed operands are pickled as they are, so a lazy Content stays lazy in the receiving process.
+        return (Content._create, (self.topic, self.subject, self.target, self.role, self.result, self._utterance,
+                                  self.operator, self._content_list, self._operands, self.day, self._text))
 
     def _process_inner_content(self, inner: Content) -> Content:
+        # The operands are complete already, so only the ones lacking a subject have to be replaced.
         if inner.subject is AGENT_UNSPEC:
             if self.operator is Operator.INQUIRE or self.operator is Operator.REQUEST:
                 return inner._copy_and_replace_subject(self.target)
             if self.subject is not AGENT_UNSPEC:
                 return inner._copy_and_replace_subject(self.subject)
-        inner._complete_inner_subject()
         return inner
 
     def _copy_and_replace_subject(self, new_subject: Agent) -> Content:
-        c: Content = self.clone()
-        c.subject = new_subject
-        c._complete_inner_subject()
-        c._normalize_text()
+        c: Content = Content.__new__(Content)
+        c._init(self.topic, new_subject, self.target, self.role, self.result, self._utterance,
+                self.operator, self._content_list, self._operands, self.day, None)
         return c
 
-    def _normalize_text(self) -> None:
+    def _get_text(self) -> str:
         str_sub: str = "" if self.subject is AGENT_UNSPEC else "ANY " if self.subject is AGENT_ANY else str(self.subject)+" "
         str_tgt: str = "ANY" if self.target is AGENT_ANY or self.target is AGENT_UNSPEC else str(self.target)
         if self.topic is not Topic.OPERATOR:
-            if self.topic is Topic.DUMMY:
-                self.text = ""
-            elif self.topic is Topic.Skip:
-                self.text = Utterance.SKIP
-            elif self.topic is Topic.Over:
-                self.text = Utterance.OVER
-            elif self.topic is Topic.AGREE or self.topic is Topic.DISAGREE:
-                self.text = str_sub + " ".join([self.topic.value, "TALK" if type(self.utterance) is Talk else "WHISPER", str(self.utterance.day), str(self.utterance.idx)])
-            elif self.topic is Topic.ESTIMATE or self.topic is Topic.COMINGOUT:
-                self.text = str_sub + " ".join([self.topic.value, str_tgt, self.role.value])
-            elif self.topic is Topic.DIVINED or self.topic is Topic.IDENTIFIED:
-                self.text = str_sub + " ".join([self.topic.value, str_tgt, self.result.value])
-            elif self.topic is Topic.ATTACK or self.topic is Topic.ATTACKED or self.topic is Topic.DIVINATION or self.topic is Topic.GUARD\
-                    or self.topic is Topic.GUARDED or self.topic is Topic.VOTE or self.topic is Topic.VOTED:
-                self.text = str_sub + " ".join([self.topic.value, str_tgt])
+            template: Optional[str] = _TEXT_TEMPLATES.get(self.topic)
+            if template is not None:
+                return template.format(sub=str_sub, tgt=str_tgt, role=self.role.value, result=self.result.value)
+            if self.topic is Topic.AGREE or self.topic is Topic.DISAGREE:
+                return str_sub + " ".join([self.topic.value, "TALK" if type(self._utterance) is Talk else "WHISPER", str(self._utterance.day), str(self._utterance.idx)])
         else:
             if self.operator is Operator.REQUEST or self.operator is Operator.INQUIRE:
-                self.text = str_sub + " ".join([self.operator.value, str_tgt, "("+Content._strip_subject(self.content_list[0].text) +
-                                                ")" if self.content_list[0].subject is self.target else "("+self.content_list[0].text+")"])
+                return str_sub + " ".join([self.operator.value, str_tgt, "("+Content._strip_subject(self.content_list[0].text) +
+                                           ")" if self.content_list[0].subject is self.target else "("+self.content_list[0].text+")"])
             elif self.operator is Operator.BECAUSE or self.operator is Operator.XOR:
-                self.text = str_sub + " ".join([self.operator.value] + ["("+Content._strip_subject(self.content_list[i].text) +
-                                                                        ")" if self.content_list[i].subject is self.subject else "("+self.content_list[i].text+")" for i in [0, 1]])
+                return str_sub + " ".join([self.operator.value] + ["("+Content._strip_subject(self.content_list[i].text) +
+                                                                   ")" if self.content_list[i].subject is self.subject else "("+self.content_list[i].text+")" for i in [0, 1]])
             elif self.operator is Operator.AND or self.operator is Operator.OR:
-                self.text = str_sub + " ".join([self.operator.value] + ["("+Content._strip_subject(c.text)+")" if c.subject is self.subject else "("+c.text+")" for c in self.content_list])
+                return str_sub + " ".join([self.operator.value] + ["("+Content._strip_subject(c.text)+")" if c.subject is self.subject else "("+c.text+")" for c in self.content_list])
             elif self.operator is Operator.NOT:
-                self.text = str_sub + " ".join([self.operator.value, "("+Content._strip_subject(self.content_list[0].text) +
-                                                ")" if self.content_list[0].subject is self.subject else "("+self.content_list[0].text+")"])
+                return str_sub + " ".join([self.operator.value, "("+Content._strip_subject(self.content_list[0].text) +
+                                           ")" if self.content_list[0].subject is self.subject else "("+self.content_list[0].text+")"])
             elif self.operator is Operator.DAY:
-                self.text = str_sub + " ".join([self.operator.value, str(self.day), "("+Content._strip_subject(self.content_list[0].text) +
-                                                ")" if self.content_list[0].subject is self.subject else "("+self.content_list[0].text+")"])
-
-    _strip_pattern: ClassVar[Pattern[str]] = re.compile(r"^(Agent\[\d+\]|ANY|)\s*([A-Z]+.*)$")
+                return str_sub + " ".join([self.operator.value, str(self.day), "("+Content._strip_subject(self.content_list[0].text) +
+                                           ")" if self.content_list[0].subject is self.subject else "("+self.content_list[0].text+")"])
+        return ""
 
     @staticmethod
     def _strip_subject(input: str) -> str:
-        m: Optional[Match[str]] = Content._strip_pattern.match(input)
-        if m:
-            return m.group(2)
+        # ^(Agent\[\d+\]|ANY|)\s*([A-Z]+.*)$, applied to normalized texts, which have no newlines.
+        rest: str = Content._split_subject(input)[1]
+        if rest and "A" <= rest[0] <= "Z" and "\n" not in rest:
+            return rest
         return input
 
     def clone(self) -> Content:
         """Clone this Content.
 
+        Content is immutable and hands out only copies of its utterance, so this Content itself is returned.
+
         Returns:
-            The cloned Content.
+            This Content.
         """
-        content: Content = copy.copy(self)
-        content.utterance = copy.copy(self.utterance)
-        content.content_list = [c.clone() for c in self.content_list]
-        return content
+        return self
+
+    _agree_keywords: ClassVar[FrozenSet[str]] = frozenset(["AGREE", "DISAGREE"])
+    _estimate_keywords: ClassVar[FrozenSet[str]] = frozenset(["ESTIMATE", "COMINGOUT"])
+    _divined_keywords: ClassVar[FrozenSet[str]] = frozenset(["DIVINED", "IDENTIFIED"])
+    _attack_keywords: ClassVar[FrozenSet[str]] = frozenset(["ATTACK", "ATTACKED", "DIVINATION", "GUARD", "GUARDED", "VOTE", "VOTED"])
+    _because_keywords: ClassVar[FrozenSet[str]] = frozenset(["BECAUSE", "AND", "OR", "XOR", "NOT", "REQUEST"])
+
+    @staticmethod
+    def _is_agent(input: str) -> bool:
+        # Agent\[\d+\]|ANY
+        if input == "ANY":
+            return True
+        return len(input) > 7 and input.startswith("Agent[") and input.endswith("]") and input[6:-1].isdecimal()
 
-    _regex_agent: ClassVar[str] = r"\s+(Agent\[\d+\]|ANY)"
-    _regex_subject: ClassVar[str] = r"^(Agent\[\d+\]|ANY|)\s*"
-    _regex_talk: ClassVar[str] = r"\s+([A-Z]+)\s+day(\d+)\s+ID:(\d+)"
-    _regex_role_species: ClassVar[str] = r"\s+([A-Z]+)"
-    _regex_paren: ClassVar[str] = r"(\(.*\))"
-    _regex_digit: ClassVar[str] = r"(\d+)"
-    _agree_pattern: ClassVar[Pattern[str]] = re.compile(_regex_subject + "(AGREE|DISAGREE)" + _regex_talk + "$")
-    _estimate_pattern: ClassVar[Pattern[str]] = re.compile(_regex_subject + "(ESTIMATE|COMINGOUT)" + _regex_agent + _regex_role_species + "$")
-    _divined_pattern: ClassVar[Pattern[str]] = re.compile(_regex_subject + "(DIVINED|IDENTIFIED)" + _regex_agent + _regex_role_species + "$")
-    _attack_pattern: ClassVar[Pattern[str]] = re.compile(_regex_subject + "(ATTACK|ATTACKED|DIVINATION|GUARD|GUARDED|VOTE|VOTED)" + _regex_agent + "$")
-    _request_pattern: ClassVar[Pattern[str]] = re.compile(_regex_subject + "(REQUEST|INQUIRE)" + _regex_agent + r"\s+" + _regex_paren + "$")
-    _because_pattern: ClassVar[Pattern[str]] = re.compile(_regex_subject + r"(BECAUSE|AND|OR|XOR|NOT|REQUEST)\s+" + _regex_paren + "$")
-    _day_pattern: ClassVar[Pattern[str]] = re.compile(_regex_subject + r"DAY\s+" + _regex_digit + r"\s+" + _regex_paren + "$")
-    _skip_pattern: ClassVar[Pattern[str]] = re.compile("^(Skip|Over)$")
+    @staticmethod
+    def _compile_agent(input: str) -> Agent:
+        # input has passed _is_agent or is empty.
+        if not input:
+            return AGENT_UNSPEC
+        agent: Optional[Agent] = Agent._text_map.get(input)
+        return agent if agent is not None else Agent(int(input[6:-1]))
+
+    @staticmethod
+    def _is_upper(input: str) -> bool:
+        # [A-Z]+
+        return input.isascii() and input.isalpha() and input.isupper()
+
+    @staticmethod
+    def _is_paren(input: str) -> bool:
+        # \(.*\)
+        return len(input) > 1 and input[0] == "(" and input[-1] == ")" and "\n" not in input
+
+    @staticmethod
+    def _is_canonical_agent(input: str) -> bool:
+        # True if the agent is written as in normalized texts, where Agent[00] and Agent[255] are written differently.
+        if input == "ANY":
+            return True
+        digits: str = input[6:-1]
+        return digits.isascii() and digits != "00" and digits != "255" and digits == "{:02}".format(int(digits))
+
+    @staticmethod
+    def _get_source_text(trimmed: str, subject: str, keyword: str, args: List[str]) -> Optional[str]:
+        # A leaf uttered in the normalized form keeps its source text; otherwise it is normalized when needed.
+        if subject and not Content._is_canonical_agent(subject) or not Content._is_canonical_agent(args[0]):
+            return None
+        words: List[str] = [subject, keyword] + args if subject else [keyword] + args
+        return trimmed if " ".join(words) == trimmed else None
+
+    @staticmethod
+    def _split_subject(input: str) -> Tuple[str, str]:
+        # ^(Agent\[\d+\]|ANY|)\s*
+        end: int = -1
+        if input.startswith("ANY"):
+            end = 3
+        elif input.startswith("Agent["):
+            close: int = input.find("]", 6)
+            if close > 6 and input[6:close].isdecimal():
+                end = close + 1
+        if end < 0:
+            return "", input
+        return input[:end], input[end:].lstrip()
 
     @staticmethod
     def compile(text: str) -> Content:
         """Convert the uttered text into a Content.
 
+        The results are kept in Content.cache, so a text seen recently is not parsed again.
+        The cached Contents are immutable and are shared by all the callers.
+        The operands are parsed when they are first needed, so an error in them is raised at that time.
+
         Args:
             text: The uttered text.
 
         Returns:
             The Content converted from the given text.
         """
+        if Content.cache.maxsize <= 0:
+            return Content._parse(text)
+        content: Optional[Content] = Content.cache.get(text)
+        if content is None:
+            content = Content._parse(text)
+            Content.cache.put(text, content)
+        return content
+
+    @staticmethod
+    def compile_many(texts: Iterable[str], processes: Optional[int] = None, chunksize: int = 1024) -> List[Content]:
+        """Convert the uttered texts into Contents.
+
+        Identical texts are parsed only once and share the same Content.
+        Given processes, the distinct texts are parsed by a pool of worker processes,
+        which pays off only for a large corpus on a machine with several cores.
+        The pool does not use Content.cache.
+
+        Args:
+            texts: The uttered texts.
+            processes(optional): The number of the worker processes. Defaults to None (parsed in this process).
+            chunksize(optional): The number of the texts sent to a worker at a time. Defaults to 1024.
+
+        Returns:
+            The list of the Contents converted from the given texts, in the same order.
+        """
+        text_list: List[str] = texts if isinstance(texts, list) else list(texts)
+        unique: List[str] = list(dict.fromkeys(text_list))
+        contents: Dict[str, Content]
+        if processes is None:
+            contents = {t: Content.compile(t) for t in unique}
+        else:
+            with ProcessPoolExecutor(max_workers=processes) as executor:
+                chunks: List[List[str]] = [unique[i:i+chunksize] for i in range(0, len(unique), chunksize)]
+                parsed: List[Content] = [c for chunk in executor.map(_parse_chunk, chunks) for c in chunk]
+            contents = dict(zip(unique, parsed))
+        return [contents[t] for t in text_list]
+
+    @staticmethod
+    def _parse(text: str) -> Content:
+        # The text is parsed in a single pass, dispatching on the keyword that follows the optional subject.
         trimmed: str = text.strip()
-        m_agree: Optional[Match[str]] = Content._agree_pattern.match(trimmed)
-        m_estimate: Optional[Match[str]] = Content._estimate_pattern.match(trimmed)
-        m_divined: Optional[Match[str]] = Content._divined_pattern.match(trimmed)
-        m_attack: Optional[Match[str]] = Content._attack_pattern.match(trimmed)
-        m_request: Optional[Match[str]] = Content._request_pattern.match(trimmed)
-        m_because: Optional[Match[str]] = Content._because_pattern.match(trimmed)
-        m_day: Optional[Match[str]] = Content._day_pattern.match(trimmed)
-        m_skip: Optional[Match[str]] = Content._skip_pattern.match(trimmed)
-        content: Content = Content(SkipContentBuilder())
-        if m_skip:
-            content.topic = Topic[m_skip.group(1)]
-        elif m_agree:
-            content.subject = Agent.compile(m_agree.group(1))
-            content.topic = Topic[m_agree.group(2)]
-            if UtteranceType[m_agree.group(3)] is UtteranceType.TALK:
-                content.utterance = Talk(int(m_agree.group(5)), AGENT_NONE, int(m_agree.group(4)), "", 0)
+        if trimmed == "Skip" or trimmed == "Over":
+            return Content._create(Topic[trimmed], text=trimmed)
+        subject: str
+        rest: str
+        subject, rest = Content._split_subject(trimmed)
+        parts: List[str] = rest.split(None, 1)
+        if len(parts) == 2:
+            keyword: str = parts[0]
+            args: str = parts[1]
+            if keyword in Content._agree_keywords:
+                tokens: List[str] = args.split()
+                if len(tokens) == 3 and Content._is_upper(tokens[0]) and tokens[1].startswith("day") and tokens[1][3:].isdecimal() \
+                        and tokens[2].startswith("ID:") and tokens[2][3:].isdecimal():
+                    utterance: Utterance
+                    if UtteranceType[tokens[0]] is UtteranceType.TALK:
+                        utterance = Talk(int(tokens[2][3:]), AGENT_NONE, int(tokens[1][3:]), "", 0)
+                    else:
+                        utterance = Whisper(int(tokens[2][3:]), AGENT_NONE, int(tokens[1][3:]), "", 0)
+                    return Content._create(Topic[keyword], subject=Content._compile_agent(subject), utterance=utterance)
+            elif keyword in Content._estimate_keywords:
+                tokens = args.split()
+                if len(tokens) == 2 and Content._is_agent(tokens[0]) and Content._is_upper(tokens[1]):
+                    return Content._create(Topic[keyword], subject=Content._compile_agent(subject),
+                                           target=Content._compile_agent(tokens[0]), role=Role[tokens[1]],
+                                           text=Content._get_source_text(trimmed, subject, keyword, tokens))
+            elif keyword in Content._divined_keywords:
+                tokens = args.split()
+                if len(tokens) == 2 and Content._is_agent(tokens[0]) and Content._is_upper(tokens[1]):
+                    return Content._create(Topic[keyword], subject=Content._compile_agent(subject),
+                                           target=Content._compile_agent(tokens[0]), result=Species[tokens[1]],
+                                           text=Content._get_source_text(trimmed, subject, keyword, tokens))
+            elif keyword in Content._attack_keywords:
+                if Content._is_agent(args):
+                    return Content._create(Topic[keyword], subject=Content._compile_agent(subject), target=Content._compile_agent(args),
+                                           text=Content._get_source_text(trimmed, subject, keyword, [args]))
             else:
-                content.utterance = Whisper(int(m_agree.group(5)), AGENT_NONE, int(m_agree.group(4)), "", 0)
-        elif m_estimate:
-            content.subject = Agent.compile(m_estimate.group(1))
-            content.topic = Topic[m_estimate.group(2)]
-            content.target = Agent.compile(m_estimate.group(3))
-            content.role = Role[m_estimate.group(4)]
-        elif m_divined:
-            content.subject = Agent.compile(m_divined.group(1))
-            content.topic = Topic[m_divined.group(2)]
-            content.target = Agent.compile(m_divined.group(3))
-            content.result = Species[m_divined.group(4)]
-        elif m_attack:
-            content.subject = Agent.compile(m_attack.group(1))
-            content.topic = Topic[m_attack.group(2)]
-            content.target = Agent.compile(m_attack.group(3))
-        elif m_request:
-            content.topic = Topic.OPERATOR
-            content.subject = Agent.compile(m_request.group(1))
-            content.operator = Operator[m_request.group(2)]
-            content.target = Agent.compile(m_request.group(3))
-            content.content_list = Content._get_contents(m_request.group(4))
-        elif m_because:
-            content.topic = Topic.OPERATOR
-            content.subject = Agent.compile(m_because.group(1))
-            content.operator = Operator[m_because.group(2)]
-            content.content_list = Content._get_contents(m_because.group(3))
-            if content.operator is Operator.REQUEST:
-                content.target = AGENT_ANY if content.content_list[0].subject is AGENT_UNSPEC else content.content_list[0].subject
-        elif m_day:
-            content.topic = Topic.OPERATOR
-            content.subject = Agent.compile(m_day.group(1))
-            content.operator = Operator.DAY
-            content.day = int(m_day.group(2))
-            content.content_list = Content._get_contents(m_day.group(3))
-        else:
-            content.topic = Topic.Skip
-        content._complete_inner_subject()
-        content._normalize_text()
-        return content
+                tokens = args.split(None, 1)
+                operands: List[Content]
+                if (keyword == "REQUEST" or keyword == "INQUIRE") and len(tokens) == 2 and Content._is_agent(tokens[0]) \
+                        and Content._is_paren(tokens[1]):
+                    return Content._create(Topic.OPERATOR, subject=Content._compile_agent(subject), target=Content._compile_agent(tokens[0]),
+                                           operator=Operator[keyword], operands=tokens[1])
+                elif keyword in Content._because_keywords and Content._is_paren(args):
+                    operator: Operator = Operator[keyword]
+                    if operator is not Operator.REQUEST:
+                        return Content._create(Topic.OPERATOR, subject=Content._compile_agent(subject), operator=operator, operands=args)
+                    # The target of REQUEST without one is the subject of the requested action, so it is parsed now.
+                    operands = Content._get_contents(args)
+                    target: Agent = AGENT_ANY if operands[0].subject is AGENT_UNSPEC else operands[0].subject
+                    return Content._create(Topic.OPERATOR, subject=Content._compile_agent(subject), target=target,
+                                           operator=operator, content_list=operands)
+                elif keyword == "DAY" and len(tokens) == 2 and tokens[0].isdecimal() and Content._is_paren(tokens[1]):
+                    return Content._create(Topic.OPERATOR, subject=Content._compile_agent(subject), operator=Operator.DAY,
+                                           operands=tokens[1], day=int(tokens[0]))
+        return Content._create(Topic.Skip, text=Utterance.SKIP)
 
     def equals(self, other: Content) -> bool:
         """Show whether or not the given Content is equivalent to this Content.
@@ -250,6 +485,59 @@ class Content:
             return NotImplemented
         return self is __o or self.text == __o.text
 
+    def __hash__(self) -> int:
+        # Consistent with __eq__: the normalized text is the canonical form of the whole structure.
+        return hash(self.text)
+
+    ENCODED_FIELDS: ClassVar[Tuple[str, ...]] = ("topic", "operator", "subject", "target", "role", "species", "day")
+    """The names of the integers returned by encode, in order."""
+
+    def encode(self) -> Tuple[int, int, int, int, int, int, int]:
+        """Encode this Content into a fixed-width record of integers.
+
+        Topic, Operator, Role and Species are encoded as their positions in the enumeration,
+        and agents as their index numbers. The operands are not included.
+
+        Returns:
+            The tuple of the integers named by ENCODED_FIELDS.
+        """
+        return (_TOPIC_CODES[self.topic], _OPERATOR_CODES[self.operator], self.subject.agent_idx, self.target.agent_idx,
+                _ROLE_CODES[self.role], _SPECIES_CODES[self.result], self.day)
+
+    def _encode_tree(self, text_idx: int, parent: int, records: List[Tuple[int, ...]]) -> None:
+        row: int = len(records)
+        records.append((text_idx, parent) + self.encode())
+        for c in self.content_list:
+            c._encode_tree(text_idx, row, records)
+
+    @staticmethod
+    def encode_many(texts: Iterable[str]) -> numpy.ndarray:
+        """Compile the uttered texts and encode them into a NumPy structured array.
+
+        Each Content takes a row, followed by the rows of its operands in depth-first order.
+        Besides the fields of ENCODED_FIELDS, the rows have "text", the position of the text
+        in texts, and "parent", the row of the Content the operand belongs to (-1 for the top level).
+        NumPy is required only by this method.
+
+        Args:
+            texts: The uttered texts.
+
+        Returns:
+            The structured array of the encoded Contents.
+        """
+        import numpy
+        records: List[Tuple[int, ...]] = []
+        for i, text in enumerate(texts):
+            Content.compile(text)._encode_tree(i, -1, records)
+        return numpy.array(records, dtype=[("text", "i4"), ("parent", "i4"), ("topic", "u1"), ("operator", "u1"),
+                                           ("subject", "i2"), ("target", "i2"), ("role", "u1"), ("species", "u1"),
+                                           ("day", "i4")])
+
+
+def _parse_chunk(texts: List[str]) -> List[Content]:
+    # Run in the worker processes of Content.compile_many.
+    return [Content._parse(t) for t in texts]
+
 
 class Topic(Enum):
     """Enumeration type for topic."""
@@ -337,6 +625,28 @@ class Operator(Enum):
     """Exclusive disjunctive clause."""
 
 
+_TEXT_TEMPLATES: Final[Dict[Topic, str]] = {
+    Topic.DUMMY: "",
+    Topic.Skip: Utterance.SKIP,
+    Topic.Over: Utterance.OVER,
+    Topic.ESTIMATE: "{sub}ESTIMATE {tgt} {role}",
+    Topic.COMINGOUT: "{sub}COMINGOUT {tgt} {role}",
+    Topic.DIVINED: "{sub}DIVINED {tgt} {result}",
+    Topic.IDENTIFIED: "{sub}IDENTIFIED {tgt} {result}",
+    Topic.ATTACK: "{sub}ATTACK {tgt}",
+    Topic.ATTACKED: "{sub}ATTACKED {tgt}",
+    Topic.DIVINATION: "{sub}DIVINATION {tgt}",
+    Topic.GUARD: "{sub}GUARD {tgt}",
+    Topic.GUARDED: "{sub}GUARDED {tgt}",
+    Topic.VOTE: "{sub}VOTE {tgt}",
+    Topic.VOTED: "{sub}VOTED {tgt}",
+}
+_TOPIC_CODES: Final[Dict[Topic, int]] = {t: i for i, t in enumerate(Topic)}
+_OPERATOR_CODES: Final[Dict[Operator, int]] = {o: i for i, o in enumerate(Operator)}
+_ROLE_CODES: Final[Dict[Role, int]] = {r: i for i, r in enumerate(Role)}
+_SPECIES_CODES: Final[Dict[Species, int]] = {s: i for i, s in enumerate(Species)}
+
+
 class ContentBuilder:
     """A class for the builder classes to build Content of all kinds."""
 
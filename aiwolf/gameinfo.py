@@ -1,9 +1,10 @@
 """gameinfo module."""
-from typing import Dict, List, Optional, TypedDict
+from typing import Any, Callable, ClassVar, Dict, List, Optional, Set, Tuple, TypedDict, cast
 
 from aiwolf.agent import Agent, Role, Status
+from aiwolf.agentset import AgentSet
 from aiwolf.judge import Judge, _Judge
-from aiwolf.utterance import Talk, Whisper, _Utterance
+from aiwolf.utterance import Talk, UtteranceList, Whisper, _Utterance
 from aiwolf.vote import Vote, _Vote
 
 class _GameInfo(TypedDict):
@@ -29,8 +30,39 @@ class _GameInfo(TypedDict):
     voteList: List[_Vote]
     whisperList: List[_Utterance]
 
+class GameInfoDiff:
+    """The parts of a GameInfo changed by the latest packet."""
+
+    fields: Set[str]
+    """The names of the changed attributes of the GameInfo."""
+    talk_start: int
+    """The index of the first new talk in talk_list."""
+    whisper_start: int
+    """The index of the first new whisper in whisper_list."""
+    status_changed: List[Agent]
+    """The agents whose status changed."""
+
+    def __init__(self, talk_start: int = 0, whisper_start: int = 0) -> None:
+        """Initialize a new instance of GameInfoDiff.
+
+        Args:
+            talk_start(optional): The index of the first new talk. Defaults to 0.
+            whisper_start(optional): The index of the first new whisper. Defaults to 0.
+        """
+        self.fields = set()
+        self.talk_start = talk_start
+        self.whisper_start = whisper_start
+        self.status_changed = []
+
+
 class GameInfo:
-    """Class for game information."""
+    """Class for game information.
+
+    A GameInfo is kept for the whole game and each packet is merged into it,
+    so that only the new utterances and the changed fields are converted.
+    The fields other than day, talk_list and whisper_list are converted from the raw _GameInfo
+    on their first read, and the converted values are cached until a packet changes them.
+    """
 
     me: Agent
     """The agent who recieves this GameInfo."""
@@ -40,9 +72,19 @@ class GameInfo:
     """The known roles of agents."""
     status_map: Dict[Agent, Status]
     """The statuses of all agents."""
-    talk_list: List[Talk]
+    agent_list: List[Agent]
+    """The list of existing agents. The list is shared, so it must not be modified."""
+    alive_agent_list: List[Agent]
+    """The list of alive agents. The list is shared, so it must not be modified."""
+    alive_count: int
+    """The number of alive agents."""
+    alive_agents: AgentSet
+    """The set of alive agents."""
+    dead_agents: AgentSet
+    """The set of dead agents."""
+    talk_list: UtteranceList[Talk]
     """The list of today's talks."""
-    whisper_list: List[Whisper]
+    whisper_list: UtteranceList[Whisper]
     """The list of today's whispers."""
     vote_list: List[Vote]
     """The list of votes for execution."""
@@ -75,6 +117,10 @@ class GameInfo:
     """The fox killed by curse."""
     medium_result: Optional[Judge]
     """The result of the inquest."""
+    diff: GameInfoDiff
+    """The parts changed by the latest packet."""
+
+    _raw: Dict[str, Any]
 
     def __init__(self, game_info: _GameInfo) -> None:
         """Initializes a new instance of GameInfo.
@@ -82,43 +128,139 @@ class GameInfo:
         Args:
             game_info: The _GameInfo used for initialization.
         """
-        self.me = Agent(game_info["agent"])
-        self.attack_vote_list = [Vote.compile(v) for v in game_info["attackVoteList"]]
-        self.attacked_agent = GameInfo._get_agent(game_info["attackedAgent"])
-        self.cursed_fox = GameInfo._get_agent(game_info["cursedFox"])
-        self.day = game_info["day"]
-        self.divine_result = Judge.compile(game_info["divineResult"]) if game_info["divineResult"] is not None else None
-        self.executed_agent = GameInfo._get_agent(game_info["executedAgent"])
-        self.existing_role_list = [Role[r] for r in game_info["existingRoleList"]]
-        self.guarded_agent = GameInfo._get_agent(game_info["guardedAgent"])
-        self.last_dead_agent_list = [Agent(a) for a in game_info["lastDeadAgentList"]]
-        self.latest_attack_vote_list = [Vote.compile(v) for v in game_info["latestAttackVoteList"]]
-        self.latest_executed_agent = GameInfo._get_agent(game_info["latestExecutedAgent"])
-        self.latest_vote_list = [Vote.compile(v) for v in game_info["latestVoteList"]]
-        self.medium_result = Judge.compile(game_info["mediumResult"]) if game_info["mediumResult"] is not None else None
-        self.remain_talk_map = {Agent(int(k)): v for k, v in game_info["remainTalkMap"].items()}
-        self.remain_whisper_map = {Agent(int(k)): v for k, v in game_info["remainWhisperMap"].items()}
-        self.role_map = {Agent(int(k)): Role[v] for k, v in game_info["roleMap"].items()}
-        self.status_map = {Agent(int(k)): Status[v] for k, v in game_info["statusMap"].items()}
-        self.talk_list = [Talk.compile(u) for u in game_info["talkList"]]
-        self.vote_list = [Vote.compile(v) for v in game_info["voteList"]]
-        self.whisper_list = [Whisper.compile(u) for u in game_info["whisperList"]]
+        self._raw = {}
+        self.day = -1
+        self.talk_list = UtteranceList()
+        self.whisper_list = UtteranceList()
+        self.merge(game_info)
 
     @staticmethod
     def _get_agent(idx: int) -> Optional[Agent]:
         return None if idx < 0 else Agent(idx)
 
+    @staticmethod
+    def _get_judge(judge: Optional[_Judge]) -> Optional[Judge]:
+        return Judge.compile(judge) if judge is not None else None
+
+    _fields: ClassVar[Dict[str, Tuple[str, Callable[[Any], Any]]]] = {
+        "me": ("agent", Agent),
+        "attack_vote_list": ("attackVoteList", lambda l: [Vote.compile(v) for v in l]),
+        "attacked_agent": ("attackedAgent", lambda a: GameInfo._get_agent(a)),
+        "cursed_fox": ("cursedFox", lambda a: GameInfo._get_agent(a)),
+        "divine_result": ("divineResult", lambda j: GameInfo._get_judge(j)),
+        "executed_agent": ("executedAgent", lambda a: GameInfo._get_agent(a)),
+        "existing_role_list": ("existingRoleList", lambda l: [Role[r] for r in l]),
+        "guarded_agent": ("guardedAgent", lambda a: GameInfo._get_agent(a)),
+        "last_dead_agent_list": ("lastDeadAgentList", lambda l: [Agent(a) for a in l]),
+        "latest_attack_vote_list": ("latestAttackVoteList", lambda l: [Vote.compile(v) for v in l]),
+        "latest_executed_agent": ("latestExecutedAgent", lambda a: GameInfo._get_agent(a)),
+        "latest_vote_list": ("latestVoteList", lambda l: [Vote.compile(v) for v in l]),
+        "medium_result": ("mediumResult", lambda j: GameInfo._get_judge(j)),
+        "remain_talk_map": ("remainTalkMap", lambda m: {Agent(int(k)): v for k, v in m.items()}),
+        "remain_whisper_map": ("remainWhisperMap", lambda m: {Agent(int(k)): v for k, v in m.items()}),
+        "role_map": ("roleMap", lambda m: {Agent(int(k)): Role[v] for k, v in m.items()}),
+        "status_map": ("statusMap", lambda m: {Agent(int(k)): Status[v] for k, v in m.items()}),
+        "vote_list": ("voteList", lambda l: [Vote.compile(v) for v in l]),
+        "agent_list": ("statusMap", lambda m: [Agent(int(k)) for k in m]),
+        "alive_agent_list": ("statusMap", lambda m: [Agent(int(k)) for k, v in m.items() if v == Status.ALIVE.value]),
+        "alive_count": ("statusMap", lambda m: sum(1 for v in m.values() if v == Status.ALIVE.value)),
+        "alive_agents": ("statusMap", lambda m: AgentSet.from_indices(int(k) for k, v in m.items() if v == Status.ALIVE.value)),
+        "dead_agents": ("statusMap", lambda m: AgentSet.from_indices(int(k) for k, v in m.items() if v == Status.DEAD.value)),
+    }
+
+    _field_names: ClassVar[Dict[str, List[str]]] = {}
+    """The names of the fields converted from each key of the raw _GameInfo."""
+
+    def merge(self, game_info: _GameInfo) -> None:
+        """Merge a newly received _GameInfo into this GameInfo.
+
+        The cached values of the fields that differ from the previous packet are discarded,
+        and only the talks and whispers not seen yet are compiled. The changes are recorded in diff.
+
+        Args:
+            game_info: The _GameInfo to be merged.
+        """
+        new_day: bool = game_info["day"] != self.day
+        if new_day:
+            self.day = game_info["day"]
+            self.talk_list = UtteranceList()
+            self.whisper_list = UtteranceList()
+        self.start_diff()
+        if new_day:
+            self.diff.fields.update(("day", "talk_list", "whisper_list"))
+        raw: Dict[str, Any] = cast(Dict[str, Any], game_info)
+        for key, names in GameInfo._field_names.items():
+            value: Any = raw[key]
+            if key in self._raw:
+                if value == self._raw[key]:
+                    continue
+                if key == "statusMap":
+                    old: Dict[str, str] = self._raw[key]
+                    self.diff.status_changed = [Agent(int(k)) for k, v in value.items() if old.get(k) != v]
+            self._raw[key] = value
+            for name in names:
+                self.__dict__.pop(name, None)
+                self.diff.fields.add(name)
+        self.merge_talk_history(game_info["talkList"])
+        self.merge_whisper_history(game_info["whisperList"])
+
+    def __getattr__(self, name: str) -> Any:
+        # Convert a field of the raw _GameInfo on its first read and cache the result.
+        field: Optional[Tuple[str, Callable[[Any], Any]]] = GameInfo._fields.get(name)
+        if field is None:
+            raise AttributeError("'GameInfo' object has no attribute '" + name + "'")
+        value: Any = field[1](self._raw[field[0]])
+        self.__dict__[name] = value
+        return value
+
+    def start_diff(self) -> None:
+        """Start recording the changes brought by a new packet."""
+        self.diff = GameInfoDiff(self.talk_list.cursor, self.whisper_list.cursor)
+
+    def merge_talk_history(self, talk_history: List[_Utterance]) -> None:
+        """Append the talks not seen yet to talk_list.
+
+        Args:
+            talk_history: The talks received from the server.
+        """
+        if self.talk_list.add_history(talk_history, Talk.compile):
+            self.diff.fields.add("talk_list")
+
+    def merge_whisper_history(self, whisper_history: List[_Utterance]) -> None:
+        """Append the whispers not seen yet to whisper_list.
+
+        Args:
+            whisper_history: The whispers received from the server.
+        """
+        if self.whisper_list.add_history(whisper_history, Whisper.compile):
+            self.diff.fields.add("whisper_list")
+
     @property
-    def agent_list(self) -> List[Agent]:
-        """The list of existing agents."""
-        return list(self.status_map.keys())
+    def new_talk_list(self) -> List[Talk]:
+        """The list of the talks added by the latest packet."""
+        return self.talk_list.since(self.diff.talk_start)
 
     @property
-    def alive_agent_list(self) -> List[Agent]:
-        """The list of alive agents."""
-        return [i[0] for i in self.status_map.items() if i[1] == Status.ALIVE]
+    def new_whisper_list(self) -> List[Whisper]:
+        """The list of the whispers added by the latest packet."""
+        return self.whisper_list.since(self.diff.whisper_start)
+
+    def is_alive(self, agent: Agent) -> bool:
+        """Show whether or not the given agent is alive.
+
+        Args:
+            agent: The agent.
+
+        Returns:
+            True if the agent is alive, otherwise false (including the agents not in this game).
+        """
+        return (self.alive_agents._mask >> agent._agent_idx) & 1 == 1
 
     @property
     def my_role(self) -> Role:
         """The role of the player who receives this GameInfo."""
         return self.role_map[self.me]
+
+
+GameInfo._field_names = {key: [name for name, (k, _) in GameInfo._fields.items() if k == key]
+                         for key in dict.fromkeys(k for k, _ in GameInfo._fields.values())}
@@ -3,6 +3,7 @@
 from abc import ABC, abstractmethod
 
 from aiwolf.agent import Agent
+from aiwolf.constant import AGENT_NONE
 from aiwolf.content import Content
 from aiwolf.gameinfo import GameInfo
 from aiwolf.gamesetting import GameSetting
@@ -51,6 +52,16 @@ class AbstractPlayer(ABC):
         """
         return type(self).__name__
 
+    def get_vote_candidate(self) -> Agent:
+        """Return the agent this player currently intends to vote for.
+
+        The client answers with this agent when a vote, attack, guard or divination misses its deadline.
+
+        Returns:
+            The agent this player currently intends to vote for. AGENT_NONE by default.
+        """
+        return AGENT_NONE
+
     @abstractmethod
     def guard(self) -> Agent:
         """Return the agent this bodyguard wants to guard.
@@ -0,0 +1,165 @@
+"""replay module."""
+from __future__ import annotations
+
+import gzip
+import random
+import time
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from aiwolf.client import TcpipClient, _Packet
+from aiwolf.player import AbstractPlayer
+
+
+def read_record(path: str) -> Iterator[Tuple[bytes, Optional[bytes]]]:
+    """Read a packet stream recorded by TcpipClient.
+
+    Args:
+        path: The recorded gzip file.
+
+    Returns:
+        An iterator over the pairs of a raw packet line and the recorded response (None if not answered).
+    """
+    with gzip.open(path, "rb") as f:
+        packet: Optional[bytes] = None
+        for line in f:
+            line = line.rstrip(b"\n")
+            if line.startswith(b"#"):
+                continue
+            if line.startswith(b">"):
+                if packet is not None:
+                    yield packet, line[1:]
+                packet = None
+            else:
+                if packet is not None:
+                    yield packet, None
+                packet = line
+        if packet is not None:
+            yield packet, None
+
+
+def read_seed(path: str) -> Optional[int]:
+    """Read the seed of random stored in a packet stream recorded by TcpipClient.
+
+    Args:
+        path: The recorded gzip file.
+
+    Returns:
+        The seed random was given before the recorded game, or None if not stored.
+    """
+    with gzip.open(path, "rb") as f:
+        for line in f:
+            if not line.startswith(b"#"):
+                break
+            if line.startswith(b"#seed "):
+                return int(line[6:])
+    return None
+
+
+class RequestTiming:
+    """Timings of the requests of one kind."""
+
+    request: str
+    """The kind of the request."""
+    times: List[float]
+    """The time spent on each request in seconds."""
+    mismatches: int
+    """The number of the responses that differ from the recorded ones."""
+
+    def __init__(self, request: str) -> None:
+        """Initialize a new instance of RequestTiming.
+
+        Args:
+            request: The kind of the request.
+        """
+        self.request = request
+        self.times = []
+        self.mismatches = 0
+
+    @property
+    def count(self) -> int:
+        """The number of the requests."""
+        return len(self.times)
+
+    @property
+    def total(self) -> float:
+        """The total time in seconds."""
+        return sum(self.times)
+
+    @property
+    def mean(self) -> float:
+        """The mean time in seconds."""
+        return self.total / len(self.times) if self.times else 0.0
+
+    @property
+    def max(self) -> float:
+        """The longest time in seconds."""
+        return max(self.times) if self.times else 0.0
+
+
+class ReplayReport:
+    """The result of a replay."""
+
+    timings: Dict[str, RequestTiming]
+    """The timings by the kind of request."""
+    elapsed: float
+    """The wall-clock time of the whole replay in seconds."""
+
+    def __init__(self) -> None:
+        """Initialize a new instance of ReplayReport."""
+        self.timings = {}
+        self.elapsed = 0.0
+
+    @property
+    def count(self) -> int:
+        """The number of the replayed packets."""
+        return sum(t.count for t in self.timings.values())
+
+    def __str__(self) -> str:
+        lines: List[str] = ["{:<16} {:>7} {:>11} {:>11} {:>11} {:>10}".format("request", "count", "total[ms]",
+                                                                           "mean[us]", "max[us]", "mismatch")]
+        for t in sorted(self.timings.values(), key=lambda t: t.total, reverse=True):
+            lines.append("{:<16} {:>7} {:>11.2f} {:>11.1f} {:>11.1f} {:>10}".format(t.request, t.count, t.total * 1e3,
+                                                                                   t.mean * 1e6, t.max * 1e6, t.mismatches))
+        lines.append("{} packets in {:.3f} s ({:.0f} packets/s)".format(self.count, self.elapsed,
+                                                                     self.count / self.elapsed if self.elapsed > 0 else 0.0))
+        return "\n".join(lines)
+
+
+def replay(path: str, player: AbstractPlayer, name: Optional[str] = None, request_role: str = "none",
+           seed: Optional[int] = None) -> ReplayReport:
+    """Feed a recorded packet stream to the player as fast as possible.
+
+    The packets go through TcpipClient._get_response, so the whole client stack is exercised without a server.
+    random is seeded before the first packet, so that a player making random choices takes the same
+    decision paths on every replay, and the recorded ones if the seed is the recorded one.
+
+    Args:
+        path: The gzip file recorded by TcpipClient.
+        player: The player to be driven.
+        name(optional): The name answered to NAME requests. Defaults to None (the player's name).
+        request_role(optional): The role answered to ROLE requests. Defaults to "none".
+        seed(optional): The seed given to random. Defaults to None (the seed stored in the record, or 0 if none).
+
+    Returns:
+        The timings of the replayed requests.
+    """
+    client: TcpipClient = TcpipClient(player, name, "", 0, request_role)
+    report: ReplayReport = ReplayReport()
+    if seed is None:
+        seed = read_seed(path)
+    random.seed(seed if seed is not None else 0)
+    start: float = time.perf_counter()
+    for packet, recorded in read_record(path):
+        t0: float = time.perf_counter()
+        decoded: _Packet = client.codec.loads(packet)
+        response: Optional[bytes] = TcpipClient._encode_response(client._get_response(decoded))
+        elapsed: float = time.perf_counter() - t0
+        request: str = decoded["request"]
+        timing: Optional[RequestTiming] = report.timings.get(request)
+        if timing is None:
+            timing = report.timings[request] = RequestTiming(request)
+        timing.times.append(elapsed)
+        if (response[:-1] if response is not None else None) != recorded:
+            timing.mismatches += 1
+    report.elapsed = time.perf_counter() - start
+    return report
@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 from enum import Enum
-from typing import Final, TypedDict
+from typing import Callable, Final, Iterable, List, Set, Tuple, TypedDict, TypeVar
 
 from aiwolf.agent import Agent
 from aiwolf.constant import AGENT_NONE
@@ -134,3 +134,103 @@ class Whisper(Utterance):
         w.text = utterance["text"]
         w.turn = utterance["turn"]
         return w
+
+
+U = TypeVar("U", bound=Utterance)
+
+
+class UtteranceList(List[U]):
+    """List of utterances indexed by (day, idx).
+
+    Duplicate utterances are detected in O(1) whatever order they are delivered in.
+    Use add, add_all and add_history to keep the index in step with the list.
+    """
+
+    _keys: Set[Tuple[int, int]]
+
+    def __init__(self, utterances: Iterable[U] = ()) -> None:
+        """Initialize a new instance of UtteranceList.
+
+        Args:
+            utterances(optional): The initial utterances. Defaults to ().
+        """
+        super().__init__()
+        self._keys = set()
+        self.add_all(utterances)
+
+    def has(self, day: int, idx: int) -> bool:
+        """Show whether or not the utterance of the given date and index number is in this list.
+
+        Args:
+            day: The date of the utterance.
+            idx: The index number of the utterance.
+
+        Returns:
+            True if the utterance is in this list, otherwise false.
+        """
+        return (day, idx) in self._keys
+
+    def add(self, utterance: U) -> bool:
+        """Append the utterance unless it is already in this list.
+
+        Args:
+            utterance: The utterance to be appended.
+
+        Returns:
+            True if the utterance is appended, otherwise false.
+        """
+        key: Tuple[int, int] = (utterance.day, utterance.idx)
+        if key in self._keys:
+            return False
+        self._keys.add(key)
+        self.append(utterance)
+        return True
+
+    def add_all(self, utterances: Iterable[U]) -> int:
+        """Append the utterances not in this list yet.
+
+        Args:
+            utterances: The utterances to be appended.
+
+        Returns:
+            The number of the appended utterances.
+        """
+        return sum(1 for u in utterances if self.add(u))
+
+    def add_history(self, history: List[_Utterance], compile: Callable[[_Utterance], U]) -> int:
+        """Compile and append the received utterances not in this list yet.
+
+        The duplicates are skipped before being compiled.
+
+        Args:
+            history: The utterances received from the server.
+            compile: The function converting a _Utterance into an utterance.
+
+        Returns:
+            The number of the appended utterances.
+        """
+        keys: Set[Tuple[int, int]] = self._keys
+        count: int = 0
+        for u in history:
+            key: Tuple[int, int] = (u["day"], u["idx"])
+            if key not in keys:
+                keys.add(key)
+                self.append(compile(u))
+                count += 1
+        return count
+
+    @property
+    def cursor(self) -> int:
+        """The position following the last utterance, to be passed to since later."""
+        return len(self)
+
+    def since(self, cursor: int) -> List[U]:
+        """Return the utterances appended after the given cursor.
+
+        Args:
+            cursor: The cursor obtained before.
+
+        Returns:
+            The list of the utterances appended since the cursor.
+        """
+        return self[cursor:]
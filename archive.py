@@ -0,0 +1,137 @@
+from array import array
+from typing import Dict, List, Optional, Tuple
+
+from aiwolf import Agent, Content, Talk
+
+# Columns and their array typecodes. The ones after speaker hold Content.encode(), content_day being its "day".
+COLUMNS: Tuple[Tuple[str, str], ...] = (("day", "i"), ("turn", "i"), ("idx", "i"), ("speaker", "h"),
+                                        ("topic", "B"), ("operator", "B"), ("subject", "h"), ("target", "h"),
+                                        ("role", "B"), ("species", "B"), ("content_day", "i"))
+
+
+class TalkArchive:
+    """Columnar archive of the talks of the whole game, one row per talk.
+
+    append() only keeps the talk and its Content; the rows are written to the columns in one batch
+    when the archive is next read, so the archive costs next to nothing in update() until it is used.
+    The columns are arrays preallocated to a capacity that doubles when full, and clear() only resets
+    the row count, so the buffers are reused from game to game.
+    The rows of a day are contiguous, so a day is a slice; the rows of each speaker are indexed as well.
+    The views returned are valid until the next clear().
+    """
+    talks: List[Talk] # Talk of each row.
+    _pending: List[Content] # Contents of the rows not written to the columns yet, following the written ones.
+    _written: int # Number of the rows written to the columns.
+    _capacity: int
+    _columns: Dict[str, array] # Column by name.
+    _column_list: List[array] # Columns in the order of COLUMNS.
+    _day_offsets: List[int] # First row of each day.
+    _speaker_rows: Dict[int, array] # Rows by speaker index.
+    _speaker_len: Dict[int, int] # Number of the rows in _speaker_rows by speaker index.
+
+    def __init__(self, capacity: int = 1024) -> None:
+        self.talks = []
+        self._pending = []
+        self._written = 0
+        self._capacity = max(capacity, 1)
+        self._columns = {name: array(code, bytes(array(code).itemsize * self._capacity)) for name, code in COLUMNS}
+        self._column_list = list(self._columns.values())
+        self._day_offsets = []
+        self._speaker_rows = {}
+        self._speaker_len = {}
+
+    def __len__(self) -> int:
+        return len(self.talks)
+
+    @property
+    def size(self) -> int:
+        """Number of the rows."""
+        return len(self.talks)
+
+    def clear(self) -> None:
+        """Remove all the rows, keeping the buffers."""
+        self.talks.clear()
+        self._pending.clear()
+        self._written = 0
+        self._day_offsets.clear()
+        for s in self._speaker_len:
+            self._speaker_len[s] = 0
+
+    def append(self, talk: Talk, content: Content) -> None:
+        """Add a talk and its Content as a new row. The talks must come in order of day."""
+        self.talks.append(talk)
+        self._pending.append(content)
+
+    def _flush(self) -> None:
+        # Write the pending rows, one slice assignment per column.
+        contents: List[Content] = self._pending
+        if not contents:
+            return
+        start: int = self._written
+        end: int = start + len(contents)
+        while self._capacity < end:
+            self._grow()
+        talks: List[Talk] = self.talks[start:end]
+        rows: List[Tuple[int, ...]] = [(t.day, t.turn, t.idx, t.agent.agent_idx) + c.encode() for t, c in zip(talks, contents)]
+        values: List[Tuple[int, ...]] = list(zip(*rows))
+        for (_, code), column, column_values in zip(COLUMNS, self._column_list, values):
+            # Through a view, as slice assignment to an array fails while a view of it exists.
+            with memoryview(column) as view:
+                view[start:end] = array(code, column_values)
+        for row, day in enumerate(values[0], start):
+            while len(self._day_offsets) <= day:
+                self._day_offsets.append(row)
+        for row, speaker in enumerate(values[3], start):
+            self._add_speaker_row(speaker, row)
+        self._written = end
+        contents.clear()
+
+    def _add_speaker_row(self, speaker: int, row: int) -> None:
+        rows: Optional[array] = self._speaker_rows.get(speaker)
+        n: int = self._speaker_len.get(speaker, 0)
+        if rows is None or n == len(rows):
+            # A new array, so that the views of the old one stay valid.
+            rows = self._speaker_rows[speaker] = array("i", rows[:n] if rows is not None else ()) + array("i", bytes(4 * max(n, 16)))
+        rows[n] = row
+        self._speaker_len[speaker] = n + 1
+
+    def _grow(self) -> None:
+        # New arrays rather than resizing, as resizing fails while a view of the old one exists.
+        self._capacity *= 2
+        for name, code in COLUMNS:
+            padding: int = self._capacity - self._written
+            self._columns[name] = self._columns[name][:self._written] + array(code, bytes(array(code).itemsize * padding))
+        self._column_list = list(self._columns.values())
+
+    def day_range(self, day: int) -> Tuple[int, int]:
+        """The rows of the day as (start, end)."""
+        self._flush()
+        if day < 0 or day >= len(self._day_offsets):
+            return self.size, self.size
+        end: int = self._day_offsets[day + 1] if day + 1 < len(self._day_offsets) else self.size
+        return self._day_offsets[day], end
+
+    def column(self, name: str, day: Optional[int] = None) -> memoryview:
+        """The values of the column for all the rows or the rows of the day, without copying."""
+        self._flush()
+        start, end = (0, self.size) if day is None else self.day_range(day)
+        return memoryview(self._columns[name])[start:end]
+
+    def day_talks(self, day: int) -> List[Talk]:
+        """The talks of the day."""
+        start, end = self.day_range(day)
+        return self.talks[start:end]
+
+    def speaker_rows(self, speaker: Agent) -> memoryview:
+        """The rows of the talks of the speaker, in order."""
+        self._flush()
+        rows: Optional[array] = self._speaker_rows.get(speaker.agent_idx)
+        if rows is None:
+            return memoryview(array("i"))
+        return memoryview(rows)[:self._speaker_len[speaker.agent_idx]]
+
+    def speaker_column(self, name: str, speaker: Agent) -> array:
+        """The values of the column for the talks of the speaker, in order."""
+        self._flush()
+        column: array = self._columns[name]
+        return array(column.typecode, [column[r] for r in self.speaker_rows(speaker)])
@@ -0,0 +1,66 @@
+"""Cost of the Agent operations the agent performs on every talk.
+
+    python bench/agent.py [--tree DIR] [--number N] [--repeat N]
+
+- Agent(7), Agent.compile("Agent[07]"), Agent.compile("ANY") and str(agent);
+- parsing "Agent[03] VOTE Agent[07]" with Content.compile, cache disabled, and reading its target and text;
+- decoding the packets of three synthetic 15-player, 6-day games as TcpipClient does: codec loads,
+  GameInfo construction or merge, and compiling the texts of talkHistory, cache disabled.
+"""
+from argparse import ArgumentParser
+from typing import Any, Callable, Dict, List
+
+import common
+import games
+
+if __name__ == "__main__":
+    parser: ArgumentParser = ArgumentParser()
+    parser.add_argument("--tree", type=str, default=None)
+    parser.add_argument("--number", type=int, default=200000)
+    parser.add_argument("--repeat", type=int, default=7)
+    args = parser.parse_args()
+    common.use_tree(args.tree)
+    from aiwolf import Agent, Content, GameInfo
+    from aiwolf.codec import get_codec
+
+    cache: Any = getattr(Content, "cache", None) # None in the trees without the cache.
+    if cache is not None:
+        cache.resize(0)
+    agent: Agent = Agent(7)
+
+    def parse() -> None:
+        c: Content = Content.compile("Agent[03] VOTE Agent[07]")
+        c.target
+        c.text
+
+    codec: Any = get_codec()
+    packets: List[bytes] = [line.encode() for seed in range(3)
+                            for line in games.lines(n=15, days=6, turns=10, seed=seed)]
+
+    def decode() -> None:
+        game_info: Any = None
+        for line in packets:
+            packet: Any = codec.loads(line)
+            if packet["gameInfo"] is not None:
+                if packet["request"] == "INITIALIZE" or game_info is None:
+                    game_info = GameInfo(packet["gameInfo"])
+                else:
+                    game_info.merge(packet["gameInfo"])
+            if packet["talkHistory"] is not None:
+                for talk in packet["talkHistory"]:
+                    Content.compile(talk["text"])
+
+    runs: Dict[str, Callable[[], object]] = {
+        "Agent(7)": lambda: Agent(7),
+        "Agent.compile(\"Agent[07]\")": lambda: Agent.compile("Agent[07]"),
+        "Agent.compile(\"ANY\")": lambda: Agent.compile("ANY"),
+        "str(agent)": lambda: str(agent),
+        "parse VOTE + text": parse,
+    }
+    for name, run in runs.items():
+        number: int = args.number if run is not parse else args.number // 10
+        times = common.best_of(run, args.repeat, number)
+        print("{:<28} {} ns (min / median)".format(name, common.min_median(times, 1e9)))
+    times = common.best_of(decode, args.repeat * 6)
+    print("{:<28} {} ms (min / median, {} packets)".format("decode packets", common.min_median(times, 1e3),
+                                                          len(packets)))
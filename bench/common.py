@@ -0,0 +1,49 @@
+"""Helpers shared by the benchmark scripts.
+
+The scripts are run from the repository root, e.g. ``python bench/cpu_client.py``.
+Most of them take ``--tree DIR`` to measure another checkout of the repository instead,
+e.g. one made with ``git worktree add ../before <commit>``, so that before/after numbers
+come from the same script.
+"""
+import os
+import sys
+import time
+from typing import Callable, List, Optional
+
+ROOT: str = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def use_tree(tree: Optional[str]) -> str:
+    """Put the tree to be measured first on sys.path. Must be called before aiwolf is imported.
+
+    Args:
+        tree: The root of the tree, or None for this repository.
+
+    Returns:
+        The absolute path of the tree.
+    """
+    path: str = os.path.abspath(tree if tree is not None else ROOT)
+    sys.path.insert(0, path)
+    return path
+
+
+def quiet_agent() -> None:
+    """Turn off the debug output of the agent."""
+    from analyzer import Analyzer
+    Analyzer.debug_mode = False
+
+
+def best_of(func: Callable[[], object], repeat: int, number: int = 1) -> List[float]:
+    """Time func, number calls per run, and return the sorted per-call times of the runs in seconds."""
+    times: List[float] = []
+    for _ in range(repeat):
+        t0: float = time.perf_counter()
+        for _ in range(number):
+            func()
+        times.append((time.perf_counter() - t0) / number)
+    return sorted(times)
+
+
+def min_median(times: List[float], scale: float = 1e6) -> str:
+    """Format sorted times as "min / median" in the given unit (microseconds by default)."""
+    return "{:.1f} / {:.1f}".format(times[0] * scale, times[len(times) // 2] * scale)
@@ -0,0 +1,56 @@
+"""Cost of Content.compile on the talk texts of synthetic games.
+
+    python bench/compile.py [--tree DIR] [--count N] [--repeat N]
+
+- per text: compiling each leaf, nested and mixed text, with the cache disabled;
+- stream: compiling a stream of talks and reading them as HyunjiVillager.update does
+  (topic and operator, and the operands of REQUESTs only), with the cache disabled and enabled.
+"""
+from argparse import ArgumentParser
+from typing import Any, Callable, List
+
+import common
+import games
+
+if __name__ == "__main__":
+    parser: ArgumentParser = ArgumentParser()
+    parser.add_argument("--tree", type=str, default=None)
+    parser.add_argument("--count", type=int, default=50000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    common.use_tree(args.tree)
+    from aiwolf import Content, Operator
+
+    cache: Any = getattr(Content, "cache", None) # None in the trees without the cache.
+
+    def set_cache(enabled: bool) -> None:
+        if cache is not None:
+            cache.clear()
+            cache.resize(1024 if enabled else 0)
+
+    texts: List[str] = games.talk_texts(args.count)
+    distinct: List[str] = list(dict.fromkeys(texts))
+    groups = (("leaf", [t for t in distinct if "(" not in t]), ("nested", [t for t in distinct if "(" in t]),
+              ("mixed", distinct))
+    set_cache(False)
+    for name, group in groups:
+        times: List[float] = common.best_of(lambda: [Content.compile(t) for t in group], args.repeat, 20)
+        print("per text {:<8} {} us (min / median, {} texts)".format(
+            name, common.min_median([t / len(group) for t in times]), len(group)))
+
+    def stream() -> None:
+        for text in texts:
+            c: Content = Content.compile(text)
+            c.topic
+            if c.operator == Operator.REQUEST:
+                c.content_list
+
+    print("stream: {} talks, {:.0f}% nested".format(len(texts), 100 * sum("(" in t for t in texts) / len(texts)))
+    for enabled in (False, True):
+        set_cache(enabled)
+        run: Callable[[], None] = stream
+        if enabled:
+            run() # Warm the cache.
+        times = common.best_of(run, args.repeat)
+        print("stream cache {:<4} {} us/talk (min / median)".format(
+            "on" if enabled else "off", common.min_median([t / len(texts) for t in times])))
@@ -0,0 +1,61 @@
+"""Cost of Content.compile_many against compiling the texts one by one.
+
+    python bench/compile_many.py [--tree DIR] [--sizes N ...] [--distinct N] [--processes N] [--repeat N]
+
+- corpus: the talk texts of synthetic games, few of them distinct, compiled in a loop with the cache
+  enabled, by compile_many, and by compile_many with the cache disabled;
+- distinct: texts that are all distinct, compiled by compile_many in this process and in a pool.
+The pool only pays off on a machine with several cores.
+"""
+import random
+from argparse import ArgumentParser
+from typing import Any, Dict, List
+
+import common
+import games
+
+if __name__ == "__main__":
+    parser: ArgumentParser = ArgumentParser()
+    parser.add_argument("--tree", type=str, default=None)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000, 1000000])
+    parser.add_argument("--distinct", type=int, default=8000)
+    parser.add_argument("--processes", type=int, default=2)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    common.use_tree(args.tree)
+    from aiwolf import Content
+
+    cache: Any = getattr(Content, "cache", None) # None in the trees without the cache.
+    if not hasattr(Content, "compile_many"):
+        raise SystemExit("Content.compile_many is not in this tree")
+
+    def set_cache(enabled: bool) -> None:
+        if cache is not None:
+            cache.clear()
+            cache.resize(1024 if enabled else 0)
+
+    for size in args.sizes:
+        texts: List[str] = games.talk_texts(size)
+        print("corpus {} texts, {} distinct".format(size, len(set(texts))))
+        runs: Dict[str, Any] = {
+            "loop compile": (True, lambda: [Content.compile(t) for t in texts]),
+            "compile_many": (True, lambda: Content.compile_many(texts)),
+            "compile_many, no cache": (False, lambda: Content.compile_many(texts)),
+        }
+        for name, (enabled, run) in runs.items():
+            set_cache(enabled)
+            times: List[float] = common.best_of(run, args.repeat)
+            print("  {:<24} {} ms (min / median)".format(name, common.min_median(times, 1e3)))
+
+    # Days far beyond a real game make the texts with a day or a talk ID distinct.
+    rng: random.Random = random.Random(0)
+    unique: Dict[str, None] = {}
+    while len(unique) < args.distinct:
+        unique[games.talk_text(rng, 15, rng.randint(1, 1000000))] = None
+    distinct: List[str] = list(unique)
+    set_cache(False)
+    print("distinct {} texts".format(len(distinct)))
+    times = common.best_of(lambda: Content.compile_many(distinct), args.repeat)
+    print("  {:<24} {} ms (min / median)".format("serial", common.min_median(times, 1e3)))
+    times = common.best_of(lambda: Content.compile_many(distinct, processes=args.processes), args.repeat)
+    print("  {:<24} {} ms (min / median)".format("processes={}".format(args.processes), common.min_median(times, 1e3)))
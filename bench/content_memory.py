@@ -0,0 +1,72 @@
+"""Memory and construction time of Content.
+
+    python bench/content_memory.py [--tree DIR] [--games N] [--repeat N]
+
+- memory: the bytes traced by tracemalloc that stay allocated while the Contents of all the talks
+  of a synthetic 15-player, 4-day game are held, per game and per Content;
+- time: Content.compile per distinct talk text, a leaf builder (VOTE), a nested builder
+  (BECAUSE (ESTIMATE) (REQUEST ANY (VOTE))) and clone() of its result.
+The Content cache is disabled, so that every talk gets its own Content as in the trees without the cache.
+"""
+import gc
+import json
+import tracemalloc
+from argparse import ArgumentParser
+from typing import Any, List
+
+import common
+import games
+
+if __name__ == "__main__":
+    parser: ArgumentParser = ArgumentParser()
+    parser.add_argument("--tree", type=str, default=None)
+    parser.add_argument("--games", type=int, default=5)
+    parser.add_argument("--repeat", type=int, default=7)
+    args = parser.parse_args()
+    common.use_tree(args.tree)
+    from aiwolf import (Agent, BecauseContentBuilder, Content, EstimateContentBuilder, RequestContentBuilder, Role,
+                        VoteContentBuilder)
+    from aiwolf.constant import AGENT_ANY
+
+    cache: Any = getattr(Content, "cache", None) # None in the trees without the cache.
+    if cache is not None:
+        cache.resize(0)
+
+    talk_lists: List[List[str]] = []
+    for seed in range(args.games):
+        texts: List[str] = []
+        for line in games.lines(n=15, days=4, seed=seed):
+            history: Any = json.loads(line)["talkHistory"]
+            if history:
+                texts.extend(talk["text"] for talk in history)
+        talk_lists.append(texts)
+    Content.compile("Skip") # Import-time and first-call allocations are not counted.
+    sizes: List[int] = []
+    for texts in talk_lists:
+        gc.collect()
+        tracemalloc.start()
+        contents: List[Content] = [Content.compile(t) for t in texts]
+        gc.collect()
+        sizes.append(tracemalloc.get_traced_memory()[0])
+        tracemalloc.stop()
+        del contents
+    count: int = sum(map(len, talk_lists))
+    print("memory  {:.1f} KB per game ({} talks), {:.0f} bytes per Content".format(
+        sum(sizes) / len(sizes) / 1024, count // len(talk_lists), sum(sizes) / count))
+
+    distinct: List[str] = list(dict.fromkeys(t for texts in talk_lists for t in texts))
+    times: List[float] = common.best_of(lambda: [Content.compile(t) for t in distinct], args.repeat)
+    print("compile         {} us per text (min / median, {} texts)".format(
+        common.min_median([t / len(distinct) for t in times]), len(distinct)))
+
+    def nested() -> Content:
+        vote: Content = Content(VoteContentBuilder(Agent(3)))
+        return Content(BecauseContentBuilder(Content(EstimateContentBuilder(Agent(3), Role.WEREWOLF)),
+                                             Content(RequestContentBuilder(AGENT_ANY, vote))))
+
+    built: Content = nested()
+    print("leaf builder    {} us (min / median)".format(common.min_median(
+        common.best_of(lambda: Content(VoteContentBuilder(Agent(3))), args.repeat, 2000))))
+    print("nested builder  {} us (min / median)".format(common.min_median(common.best_of(nested, args.repeat, 500))))
+    print("clone           {} us (min / median)".format(common.min_median(
+        common.best_of(built.clone, args.repeat, 2000))))
@@ -0,0 +1,44 @@
+"""CPU time TcpipClient spends in a game, most of which is spent waiting for the server.
+
+    python bench/cpu_client.py [--tree DIR] [--idle SECONDS] [--games N] [--repeat N]
+
+The stand-in server runs in its own process, so only the client's CPU time is counted.
+"""
+import os
+import resource
+import subprocess
+import sys
+import time
+from argparse import ArgumentParser
+from typing import IO, List
+
+import common
+
+if __name__ == "__main__":
+    parser: ArgumentParser = ArgumentParser()
+    parser.add_argument("--tree", type=str, default=None)
+    parser.add_argument("--idle", type=float, default=0.05)
+    parser.add_argument("--games", type=int, default=1)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    common.use_tree(args.tree)
+    common.quiet_agent()
+    from aiwolf import TcpipClient
+    from hyunji_agent import HyunjiPlayer
+
+    server_script: str = os.path.join(os.path.dirname(os.path.abspath(__file__)), "server.py")
+    for _ in range(args.repeat):
+        server: subprocess.Popen = subprocess.Popen([sys.executable, server_script, "--idle", str(args.idle),
+                                                     "--games", str(args.games)], stdout=subprocess.PIPE, text=True)
+        out: IO[str] = server.stdout  # type: ignore
+        port: int = int(out.readline().split()[1])
+        r0: resource.struct_rusage = resource.getrusage(resource.RUSAGE_SELF)
+        w0: float = time.perf_counter()
+        TcpipClient(HyunjiPlayer("bench"), "bench", "127.0.0.1", port, "none").connect()
+        wall: float = time.perf_counter() - w0
+        r1: resource.struct_rusage = resource.getrusage(resource.RUSAGE_SELF)
+        responses: List[str] = out.read().split()
+        server.wait()
+        cpu: float = (r1.ru_utime - r0.ru_utime) + (r1.ru_stime - r0.ru_stime)
+        print("wall {:.2f} s  cpu {:.3f} s  ({:.1f}% of a core)  {} responses".format(
+            wall, cpu, 100 * cpu / wall, responses[0] if responses else 0))
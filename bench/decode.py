@@ -0,0 +1,31 @@
+"""Packet decoding and agentIdx encoding with each available codec.
+
+    python bench/decode.py [--repeat N]
+
+The packets are the ten largest ones of a synthetic 15-player, 6-day game.
+"""
+import json
+from argparse import ArgumentParser
+from typing import List
+
+import common
+import games
+
+if __name__ == "__main__":
+    parser: ArgumentParser = ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+    common.use_tree(None)
+    from aiwolf.codec import Codec, OrjsonCodec, encode_agent_idx, orjson
+
+    packets: List[bytes] = sorted((line.encode() for line in games.lines(n=15, days=6)), key=len)[-10:]
+    print("{} packets, {:.1f} KB on average".format(len(packets), sum(map(len, packets)) / len(packets) / 1024))
+    codecs: List[Codec] = [Codec()] + ([OrjsonCodec()] if orjson is not None else [])
+    for codec in codecs:
+        times: List[float] = common.best_of(lambda: [codec.loads(p) for p in packets], args.repeat)
+        print("decode {:<12} {} us/packet (min / median)".format(type(codec).__name__,
+                                                                 common.min_median([t / len(packets) for t in times])))
+    print("agentIdx json.dumps     {} us".format(common.min_median(common.best_of(
+        lambda: json.dumps({"agentIdx": 7}, separators=(",", ":")), args.repeat, 1000))))
+    print("agentIdx table          {} us".format(common.min_median(common.best_of(
+        lambda: encode_agent_idx(7), args.repeat, 1000))))
@@ -0,0 +1,158 @@
+"""Check that two trees give the same GameInfo contents and the same HyunjiPlayer responses.
+
+    python bench/equivalence.py --against DIR [--tree DIR]
+    python bench/equivalence.py --dump OUT.json [--tree DIR]
+
+Synthetic games (games.py) are fed through TcpipClient._get_response:
+- 8 games (seeds 0-3, 5 and 15 players, dense and sparse packets) to a player snapshotting
+  the player-visible GameInfo fields at every initialize() and update();
+- 36 games (seeds 0-5, every role of the player) to HyunjiPlayer with random seeded,
+  recording every response, and the type of the exception when the agent raises.
+With --against, both trees are dumped in subprocesses and the dumps are compared.
+"""
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+from argparse import ArgumentParser
+from enum import Enum
+from typing import Any, Dict, List, Optional
+
+import common
+import games
+
+FIELDS: List[str] = ["me", "day", "role_map", "status_map", "talk_list", "whisper_list", "vote_list", "latest_vote_list",
+                     "executed_agent", "latest_executed_agent", "last_dead_agent_list", "attack_vote_list",
+                     "latest_attack_vote_list", "attacked_agent", "divine_result", "guarded_agent", "remain_talk_map",
+                     "remain_whisper_map", "existing_role_list", "cursed_fox", "medium_result", "agent_list",
+                     "alive_agent_list", "my_role"]
+
+
+def normalize(value: Any) -> Any:
+    """A JSON form of the value, independent of the classes of the tree."""
+    from aiwolf import Agent
+    if isinstance(value, Agent):
+        return "A%d" % value.agent_idx
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, dict):
+        return sorted([normalize(k), normalize(v)] for k, v in value.items())
+    if isinstance(value, (list, tuple)) or type(value).__name__ in ("UtteranceList", "AgentSet"):
+        return [normalize(v) for v in value]
+    if value is None or isinstance(value, (int, str, float, bool)):
+        return value
+    # Judge, Vote, Talk, ...: their public annotated attributes.
+    fields: Dict[str, Any] = {k: normalize(getattr(value, k)) for k in sorted(vars(type(value)).get("__annotations__", {}))
+                              if not k.startswith("_")}
+    fields["T"] = type(value).__name__
+    return fields
+
+
+def dump() -> Dict[str, List[Any]]:
+    from aiwolf import AbstractPlayer, Agent, Content, GameInfo, GameSetting, SkipContentBuilder, TcpipClient
+    from aiwolf.constant import AGENT_NONE
+    from hyunji_agent import HyunjiPlayer
+
+    class Snapshots(AbstractPlayer):
+        log: List[Any]
+
+        def __init__(self) -> None:
+            self.log = []
+
+        def snap(self, tag: str, game_info: GameInfo) -> None:
+            self.log.append([tag] + [normalize(getattr(game_info, f)) for f in FIELDS])
+
+        def initialize(self, game_info: GameInfo, game_setting: GameSetting) -> None:
+            self.snap("initialize", game_info)
+
+        def update(self, game_info: GameInfo) -> None:
+            self.snap("update", game_info)
+
+        def attack(self) -> Agent:
+            return AGENT_NONE
+
+        divine = guard = vote = attack
+
+        def talk(self) -> Content:
+            return Content(SkipContentBuilder())
+
+        whisper = talk
+
+        def day_start(self) -> None:
+            pass
+
+        def finish(self) -> None:
+            pass
+
+    result: Dict[str, List[Any]] = {"snapshots": [], "responses": []}
+    for seed in range(4):
+        for n in (5, 15):
+            player: Snapshots = Snapshots()
+            client: TcpipClient = TcpipClient(player, "bench", "", 0, "none")
+            for line in games.lines(n=n, seed=seed, days=(2 if n == 5 else 4), sparse=seed % 2 == 1):
+                client._get_response(json.loads(line))
+            result["snapshots"].append(player.log)
+    common.quiet_agent()
+    for seed in range(6):
+        for role in games.PLAYER_ROLES:
+            random.seed(seed)
+            client = TcpipClient(HyunjiPlayer("bench"), "bench", "", 0, "none")
+            responses: List[Any] = []
+            for line in games.lines(n=15, seed=seed, role=role, sparse=seed % 2 == 1):
+                try:
+                    response: Any = client._get_response(json.loads(line))
+                except Exception as e:  # The agent's own bugs are part of its behaviour.
+                    response = "raised " + type(e).__name__
+                responses.append(response.decode() if isinstance(response, bytes) else response)
+            result["responses"].append(responses)
+    return result
+
+
+def compare(expected: Dict[str, List[Any]], actual: Dict[str, List[Any]]) -> int:
+    """Print the differences and return their number."""
+    differences: int = 0
+    for key in ("snapshots", "responses"):
+        for g, (e, a) in enumerate(zip(expected[key], actual[key])):
+            if len(e) != len(a):
+                print("{} of game {}: {} entries, expected {}".format(key, g, len(a), len(e)))
+                differences += 1
+            for i, (x, y) in enumerate(zip(e, a)):
+                if x != y:
+                    differences += 1
+                    if differences <= 10:
+                        print("{} of game {}, entry {}: {!r:.200} != {!r:.200}".format(key, g, i, y, x))
+    return differences
+
+
+def dump_tree(tree: Optional[str], path: str) -> Dict[str, List[Any]]:
+    command: List[str] = [sys.executable, os.path.abspath(__file__), "--dump", path]
+    if tree is not None:
+        command += ["--tree", tree]
+    subprocess.run(command, check=True)
+    with open(path) as f:
+        return json.load(f)
+
+
+if __name__ == "__main__":
+    parser: ArgumentParser = ArgumentParser()
+    parser.add_argument("--tree", type=str, default=None)
+    parser.add_argument("--dump", type=str, default=None)
+    parser.add_argument("--against", type=str, default=None)
+    args = parser.parse_args()
+    if args.dump is not None:
+        common.use_tree(args.tree)
+        with open(args.dump, "w") as f:
+            json.dump(dump(), f)
+    elif args.against is not None:
+        with tempfile.TemporaryDirectory() as tmp:
+            expected: Dict[str, List[Any]] = dump_tree(args.against, os.path.join(tmp, "expected.json"))
+            actual: Dict[str, List[Any]] = dump_tree(args.tree, os.path.join(tmp, "actual.json"))
+        count: int = compare(expected, actual)
+        print("{} snapshots of {} games, {} responses of {} games: {} differences".format(
+            sum(len(s) for s in actual["snapshots"]), len(actual["snapshots"]),
+            sum(len(r) for r in actual["responses"]), len(actual["responses"]), count))
+        sys.exit(1 if count else 0)
+    else:
+        parser.error("either --dump or --against is required")
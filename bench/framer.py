@@ -0,0 +1,86 @@
+"""Framing of the packet stream: the old str split-and-recv loop against _LineFramer.
+
+    python bench/framer.py [--tree DIR] [--repeat N]
+
+The stream is the packets of four synthetic 15-player, 6-day games, cut into chunks as recv would return them:
+8 KB and 1 KB (packets split across chunks), 256 KB (several packets per chunk) and random 1 B..20 KB.
+Both sides decode every frame with json.loads, as the old loop did. The old loop is the receive loop of
+TcpipClient.connect before _LineFramer, with an empty recv standing for a socket timeout once the chunks run out.
+"""
+import json
+import random
+from argparse import ArgumentParser
+from typing import Any, Callable, Dict, List
+
+import common
+import games
+
+
+def chunked(stream: bytes, size: int) -> List[bytes]:
+    return [stream[i:i+size] for i in range(0, len(stream), size)]
+
+
+def random_chunked(stream: bytes, low: int, high: int, seed: int = 0) -> List[bytes]:
+    rng: random.Random = random.Random(seed)
+    chunks: List[bytes] = []
+    i: int = 0
+    while i < len(stream):
+        size: int = rng.randint(low, high)
+        chunks.append(stream[i:i+size])
+        i += size
+    return chunks
+
+
+def old_loop(chunks: List[bytes]) -> List[Any]:
+    # The loop of TcpipClient.connect at 71afdbd, one recv per iteration.
+    packets: List[Any] = []
+    received = iter(chunks)
+    line: str = ""
+    while True:
+        data: bytes = next(received, b"")
+        line += data.decode("utf-8")
+        if line == "":
+            break
+        line_list: List[str] = line.split("\n", 1)
+        for i in range(len(line_list) - 1):
+            if len(line_list[i]) > 0:
+                packets.append(json.loads(line_list[i]))
+            line = line_list[-1]
+        try:
+            packets.append(json.loads(line))
+            line = ""
+        except ValueError:
+            pass
+    return packets
+
+
+if __name__ == "__main__":
+    parser: ArgumentParser = ArgumentParser()
+    parser.add_argument("--tree", type=str, default=None)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    common.use_tree(args.tree)
+    from aiwolf.client import _LineFramer
+
+    def new_loop(chunks: List[bytes]) -> List[Any]:
+        framer: _LineFramer = _LineFramer()
+        return [json.loads(frame) for chunk in chunks for frame in framer.feed(chunk)]
+
+    lines: List[bytes] = [line.encode() for seed in range(4) for line in games.lines(n=15, days=6, turns=10, seed=seed)]
+    stream: bytes = b"".join(line + b"\n" for line in lines)
+    print("{} packets, {:.2f} MB, largest {:.1f} KB".format(len(lines), len(stream) / 1e6,
+                                                              max(map(len, lines)) / 1024))
+    streams: Dict[str, List[bytes]] = {
+        "8 KB chunks": chunked(stream, 8192),
+        "1 KB chunks": chunked(stream, 1024),
+        "256 KB chunks": chunked(stream, 262144),
+        "random 1 B..20 KB": random_chunked(stream, 1, 20480),
+    }
+    expected: List[Any] = [json.loads(line) for line in lines]
+    loops: Dict[str, Callable[[List[bytes]], List[Any]]] = {"old": old_loop, "_LineFramer": new_loop}
+    for name, chunks in streams.items():
+        for loop_name, loop in loops.items():
+            if loop(chunks) != expected:
+                raise SystemExit("{} gave other packets on {}".format(loop_name, name))
+            times: List[float] = common.best_of(lambda: loop(chunks), args.repeat)
+            print("{:<18} {:<12} {} ms (min / median)".format(name, loop_name, common.min_median(times, 1e3)))
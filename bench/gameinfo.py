@@ -0,0 +1,39 @@
+"""Cost of building a GameInfo from each packet of a game, with and without reading fields.
+
+    python bench/gameinfo.py [--tree DIR] [--repeat N]
+
+The packets carrying gameInfo of synthetic 15-player games are converted one by one.
+"""
+import json
+from argparse import ArgumentParser
+from typing import Any, List
+
+import common
+import games
+
+if __name__ == "__main__":
+    parser: ArgumentParser = ArgumentParser()
+    parser.add_argument("--tree", type=str, default=None)
+    parser.add_argument("--repeat", type=int, default=15)
+    args = parser.parse_args()
+    common.use_tree(args.tree)
+    from aiwolf import GameInfo
+
+    infos: List[Any] = [p["gameInfo"] for seed in range(4) for p in games.game(n=15, seed=seed)
+                        if p["gameInfo"] is not None]
+    # Fresh copies for every run, as a GameInfo may keep the raw values.
+    copies: List[List[Any]] = [json.loads(json.dumps(infos)) for _ in range(2 * args.repeat)]
+
+    def construct() -> None:
+        for info in copies.pop():
+            GameInfo(info)
+
+    def construct_and_read() -> None:
+        for info in copies.pop():
+            g = GameInfo(info)
+            g.me, g.status_map, g.day, g.talk_list
+
+    print("{} packets".format(len(infos)))
+    for name, func in (("construct only", construct), ("construct and read", construct_and_read)):
+        times: List[float] = common.best_of(func, args.repeat)
+        print("{:<20} {} us/packet (min / median)".format(name, common.min_median([t / len(infos) for t in times])))
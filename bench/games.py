@@ -0,0 +1,149 @@
+"""Synthetic packet streams of AIWolf games, as the server sends them.
+
+The games are random but reproducible from their seed. Every alive agent talks once per turn,
+drawing from a mix of the protocol's talk forms, leaf and nested.
+"""
+import json
+import random
+from typing import Any, Dict, List, Optional
+
+ROLES15: List[str] = ["WEREWOLF"] * 3 + ["POSSESSED", "SEER", "MEDIUM", "BODYGUARD"] + ["VILLAGER"] * 8
+ROLES5: List[str] = ["WEREWOLF", "POSSESSED", "SEER", "VILLAGER", "VILLAGER"]
+PLAYER_ROLES: List[str] = ["VILLAGER", "SEER", "POSSESSED", "MEDIUM", "BODYGUARD", "WEREWOLF"]
+
+
+def agent(i: int) -> str:
+    return "Agent[{:02}]".format(i)
+
+
+def talk_text(rng: random.Random, n: int, day: int) -> str:
+    """A random talk text of a game of n agents."""
+    i: int = rng.randint(1, n)
+    j: int = rng.randint(1, n)
+    k: int = rng.randint(1, n)
+    choices: List[str] = [
+        "Skip", "Over",
+        f"COMINGOUT {agent(i)} SEER",
+        f"COMINGOUT {agent(i)} VILLAGER",
+        f"VOTE {agent(j)}",
+        f"{agent(i)} VOTE {agent(j)}",
+        f"ESTIMATE {agent(j)} WEREWOLF",
+        f"DIVINED {agent(j)} WEREWOLF",
+        f"DIVINED {agent(j)} HUMAN",
+        f"IDENTIFIED {agent(j)} HUMAN",
+        f"VOTED {agent(j)}",
+        f"REQUEST ANY (VOTE {agent(j)})",
+        f"BECAUSE (ESTIMATE {agent(j)} WEREWOLF) (REQUEST ANY (VOTE {agent(j)}))",
+        f"AGREE TALK day{day} ID:{rng.randint(0, 20)}",
+        f"INQUIRE {agent(k)} (VOTE ANY)",
+        f"AND (VOTE {agent(j)}) (ESTIMATE {agent(k)} POSSESSED)",
+        f"DAY {day} ({agent(i)} DIVINED {agent(j)} HUMAN)",
+        f"NOT (ESTIMATE {agent(j)} SEER)",
+        f"GUARDED {agent(j)}",
+    ]
+    return rng.choice(choices)
+
+
+def game(n: int = 15, me: int = 1, role: Optional[str] = None, days: int = 4, turns: int = 5, seed: int = 0,
+         sparse: bool = False) -> List[Dict[str, Any]]:
+    """The packets of a game, from NAME to FINISH.
+
+    Args:
+        n: The number of the agents, 5 or 15.
+        me: The index number of the player.
+        role: The role of the player. None for the one drawn.
+        days: The number of the days.
+        turns: The number of the talk turns a day.
+        seed: The seed of the game.
+        sparse: If True, the requests answered within a day carry no gameInfo, as the server sends them.
+    """
+    rng: random.Random = random.Random(seed)
+    roles: List[str] = list(ROLES15 if n == 15 else ROLES5)
+    rng.shuffle(roles)
+    if role is not None:
+        r: int = roles.index(role)
+        roles[r], roles[me - 1] = roles[me - 1], roles[r]
+    status: Dict[str, str] = {str(i): "ALIVE" for i in range(1, n + 1)}
+    setting: Dict[str, Any] = {"enableNoAttack": False, "enableNoExecution": False, "enableRoleRequest": True,
+                               "maxAttackRevote": 1, "maxRevote": 1, "maxSkip": 2, "maxTalk": 10, "maxTalkTurn": 20,
+                               "maxWhisper": 10, "maxWhisperTurn": 20, "playerNum": n, "randomSeed": seed,
+                               "roleNumMap": {r: roles.count(r) for r in set(roles)}, "talkOnFirstDay": False,
+                               "timeLimit": 1000, "validateUtterance": True, "votableInFirstDay": False,
+                               "voteVisible": True, "whisperBeforeRevote": False}
+    my_role: str = roles[me - 1]
+    if my_role == "WEREWOLF":
+        role_map: Dict[str, str] = {str(i + 1): r for i, r in enumerate(roles) if r == "WEREWOLF"}
+    else:
+        role_map = {str(me): my_role}
+    packets: List[Dict[str, Any]] = [
+        {"gameInfo": None, "gameSetting": None, "request": "NAME", "talkHistory": None, "whisperHistory": None},
+        {"gameInfo": None, "gameSetting": None, "request": "ROLE", "talkHistory": None, "whisperHistory": None}]
+    vote_list: List[Dict[str, int]] = []
+
+    def info(day: int, talks: List[Dict[str, Any]], **extra: Any) -> Dict[str, Any]:
+        gi: Dict[str, Any] = {
+            "agent": me, "attackVoteList": [], "attackedAgent": -1, "cursedFox": -1, "day": day,
+            "divineResult": None, "executedAgent": -1, "existingRoleList": sorted(set(roles)),
+            "guardedAgent": -1, "lastDeadAgentList": [], "latestAttackVoteList": [], "latestExecutedAgent": -1,
+            "latestVoteList": [], "mediumResult": None,
+            "remainTalkMap": {k: 10 for k, v in status.items() if v == "ALIVE"},
+            "remainWhisperMap": {}, "roleMap": dict(role_map), "statusMap": dict(status),
+            "talkList": list(talks), "voteList": list(vote_list), "whisperList": []}
+        gi.update(extra)
+        return gi
+
+    packets.append({"gameInfo": info(0, []), "gameSetting": setting, "request": "INITIALIZE",
+                    "talkHistory": None, "whisperHistory": None})
+    executed: int = -1
+    dead: int = -1
+    for day in range(0, days):
+        alive: List[int] = [int(k) for k, v in status.items() if v == "ALIVE"]
+        extra: Dict[str, Any] = {}
+        if day > 0:
+            extra["executedAgent"] = executed
+            extra["lastDeadAgentList"] = [dead]
+        packets.append({"gameInfo": info(day, [], **extra), "gameSetting": setting, "request": "DAILY_INITIALIZE",
+                        "talkHistory": None, "whisperHistory": None})
+        talks: List[Dict[str, Any]] = []
+        idx: int = 0
+        for turn in range(turns if day > 0 else 0):
+            new: List[Dict[str, Any]] = []
+            for a in alive:
+                new.append({"day": day, "agent": a, "idx": idx, "text": talk_text(rng, n, day), "turn": turn})
+                idx += 1
+            talks.extend(new)
+            packets.append({"gameInfo": info(day, talks), "gameSetting": None, "request": "TALK",
+                            "talkHistory": new, "whisperHistory": None})
+        vote_list = [{"agent": a, "day": day, "target": rng.choice(alive)} for a in alive]
+        packets.append({"gameInfo": info(day, talks), "gameSetting": None, "request": "VOTE",
+                        "talkHistory": [], "whisperHistory": None})
+        if my_role == "SEER":
+            packets.append({"gameInfo": info(day, talks), "gameSetting": None, "request": "DIVINE",
+                            "talkHistory": [], "whisperHistory": None})
+        packets.append({"gameInfo": info(day, talks), "gameSetting": None, "request": "DAILY_FINISH",
+                        "talkHistory": [], "whisperHistory": None})
+        candidates: List[int] = [a for a in alive if a != me]
+        executed = rng.choice(candidates)
+        status[str(executed)] = "DEAD"
+        candidates.remove(executed)
+        dead = rng.choice(candidates)
+        status[str(dead)] = "DEAD"
+    final_roles: Dict[str, str] = {str(i + 1): r for i, r in enumerate(roles)}
+    packets.append({"gameInfo": info(days, [], roleMap=final_roles), "gameSetting": None, "request": "FINISH",
+                    "talkHistory": None, "whisperHistory": None})
+    if sparse:
+        for p in packets:
+            if p["request"] in ("TALK", "WHISPER", "VOTE", "DIVINE", "GUARD", "ATTACK"):
+                p["gameInfo"] = None
+    return packets
+
+
+def lines(**kwargs: Any) -> List[str]:
+    """The packets of game(**kwargs) as the lines sent by the server, without newlines."""
+    return [json.dumps(p, separators=(",", ":")) for p in game(**kwargs)]
+
+
+def talk_texts(count: int, n: int = 15, seed: int = 0) -> List[str]:
+    """count talk texts of n-agent games, cycling through days 1-6."""
+    rng: random.Random = random.Random(seed)
+    return [talk_text(rng, n, 1 + i // 500 % 6) for i in range(count)]
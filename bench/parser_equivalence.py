@@ -0,0 +1,174 @@
+"""Check that two trees compile the same Contents from fuzzed texts, e.g. the regex parser and its replacement.
+
+    python bench/parser_equivalence.py --against DIR [--tree DIR] [-n COUNT] [--seed SEED]
+
+The texts are generated from the protocol grammar with odd whitespace, Unicode digits, malformed agents
+and unknown keywords, and a quarter of them get random edits. Both trees compile every text in a
+subprocess; the Content trees are compared field by field, and the exceptions by type.
+The exceptions differing only in their messages are counted apart.
+"""
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+from argparse import ArgumentParser
+from typing import Any, List, Optional
+
+import common
+
+WHITESPACE: List[str] = [" ", " ", " ", "  ", "\t", "\n", "　", "\x1c", "\xa0", ""]
+DIGITS: List[str] = ["1", "03", "12", "255", "0", "١", "٣٥", "x", "", "1a", "²"]
+KEYWORDS: List[str] = ["AGREE", "DISAGREE", "ESTIMATE", "COMINGOUT", "DIVINED", "IDENTIFIED", "ATTACK", "ATTACKED",
+                       "DIVINATION", "GUARD", "GUARDED", "VOTE", "VOTED", "REQUEST", "INQUIRE", "BECAUSE", "AND", "OR",
+                       "XOR", "NOT", "DAY", "Skip", "Over", "vote", "ATTACKEDX", "NOP", "OPERATOR", "DUMMY"]
+ROLES: List[str] = ["WEREWOLF", "SEER", "VILLAGER", "POSSESSED", "MEDIUM", "BODYGUARD", "FOX", "FREEMASON", "ANY", "UNC",
+                    "HUMAN", "Seer", "WOLF", "WEREWOLFÉ"]
+SPECIES: List[str] = ["HUMAN", "WEREWOLF", "UNC", "ANY", "human", "SEER"]
+
+
+class TextFuzzer:
+    """Generator of texts close to the protocol grammar."""
+    rng: random.Random
+
+    def __init__(self, seed: int) -> None:
+        self.rng = random.Random(seed)
+
+    def space(self) -> str:
+        return self.rng.choice(WHITESPACE[:4]) if self.rng.random() < 0.85 else self.rng.choice(WHITESPACE)
+
+    def agent(self) -> str:
+        r: float = self.rng.random()
+        if r < 0.15:
+            return "ANY"
+        if r < 0.9:
+            return "Agent[%02d]" % self.rng.randint(0, 20)
+        return self.rng.choice(["Agent[" + self.rng.choice(DIGITS) + "]", "Agent[]", "AGENT[01]", "ANYONE", "Agent[1",
+                                "Agent[01]]"])
+
+    def subject(self) -> str:
+        if self.rng.random() < 0.55:
+            return ""
+        return self.agent() + (self.space() if self.rng.random() < 0.9 else "")
+
+    def sentence(self, depth: int = 0) -> str:
+        k: str = self.rng.choice(KEYWORDS[:13] + KEYWORDS[:13] + KEYWORDS[13:])
+        if k in ("AGREE", "DISAGREE"):
+            return (self.subject() + k + self.space() + self.rng.choice(["TALK", "WHISPER", "TALK", "TALKS", "talk"])
+                    + self.space() + "day" + self.rng.choice(DIGITS) + self.space() + "ID:" + self.rng.choice(DIGITS))
+        if k in ("ESTIMATE", "COMINGOUT"):
+            return self.subject() + k + self.space() + self.agent() + self.space() + self.rng.choice(ROLES)
+        if k in ("DIVINED", "IDENTIFIED"):
+            return self.subject() + k + self.space() + self.agent() + self.space() + self.rng.choice(SPECIES)
+        if k in KEYWORDS[6:13] or k in ("vote", "ATTACKEDX"):
+            return self.subject() + k + self.space() + self.agent()
+        if depth > 2:
+            return "Skip"
+        if k in ("REQUEST", "INQUIRE"):
+            if self.rng.random() < 0.7:
+                return self.subject() + k + self.space() + self.agent() + self.space() + "(" + self.sentence(depth + 1) + ")"
+            return self.subject() + k + self.space() + "(" + self.sentence(depth + 1) + ")"
+        if k in ("BECAUSE", "XOR", "AND", "OR"):
+            return self.subject() + k + self.space() + " ".join("(" + self.sentence(depth + 1) + ")"
+                                                                for _ in range(self.rng.choice([1, 2, 2, 3])))
+        if k == "NOT":
+            return self.subject() + k + self.space() + "(" + self.sentence(depth + 1) + ")"
+        if k == "DAY":
+            return self.subject() + k + self.space() + self.rng.choice(DIGITS) + self.space() + "(" + self.sentence(depth + 1) + ")"
+        return self.subject() + k + (self.space() + self.agent() if self.rng.random() < 0.3 else "")
+
+    def mutate(self, text: str) -> str:
+        chars: List[str] = list(text)
+        for _ in range(self.rng.randint(1, 3)):
+            op: float = self.rng.random()
+            i: int = self.rng.randint(0, len(chars))
+            if op < 0.3 and chars:
+                del chars[min(i, len(chars) - 1)]
+            elif op < 0.6:
+                chars.insert(i, self.rng.choice(" ()[]\n\tA1xD　"))
+            elif chars:
+                j: int = self.rng.randint(0, len(chars) - 1)
+                k: int = self.rng.randint(0, len(chars) - 1)
+                chars[j], chars[k] = chars[k], chars[j]
+        return "".join(chars)
+
+    def texts(self, count: int) -> List[str]:
+        out: List[str] = []
+        for _ in range(count):
+            text: str = self.sentence()
+            if self.rng.random() < 0.25:
+                text = self.mutate(text)
+            if self.rng.random() < 0.1:
+                text = self.rng.choice(WHITESPACE) + text + self.rng.choice(WHITESPACE)
+            out.append(text)
+        return out
+
+
+def normalize(content: Any) -> List[Any]:
+    """The fields of the Content tree, in a form independent of the classes of the tree."""
+    u: Any = content.utterance
+    return [content.topic.name, content.subject.agent_idx, content.target.agent_idx, content.role.name,
+            content.result.name, type(u).__name__, u.day, u.idx, u.agent.agent_idx, u.text, u.turn,
+            content.operator.name, content.day, content.text, [normalize(c) for c in content.content_list]]
+
+
+def dump(texts: List[str]) -> List[Any]:
+    from aiwolf import Content
+    results: List[Any] = []
+    for text in texts:
+        try:
+            results.append(normalize(Content.compile(text)))
+        except Exception as e:
+            results.append({"raised": type(e).__name__, "message": str(e)})
+    return results
+
+
+def dump_tree(tree: Optional[str], count: int, seed: int, path: str) -> List[Any]:
+    command: List[str] = [sys.executable, os.path.abspath(__file__), "--dump", path, "-n", str(count), "--seed", str(seed)]
+    if tree is not None:
+        command += ["--tree", tree]
+    subprocess.run(command, check=True)
+    with open(path) as f:
+        return json.load(f)
+
+
+if __name__ == "__main__":
+    parser: ArgumentParser = ArgumentParser()
+    parser.add_argument("--tree", type=str, default=None)
+    parser.add_argument("--against", type=str, default=None)
+    parser.add_argument("--dump", type=str, default=None)
+    parser.add_argument("-n", type=int, dest="count", default=300000)
+    parser.add_argument("--seed", type=int, default=12345)
+    args = parser.parse_args()
+    if args.dump is not None:
+        common.use_tree(args.tree)
+        with open(args.dump, "w") as f:
+            json.dump(dump(TextFuzzer(args.seed).texts(args.count)), f)
+    elif args.against is not None:
+        texts: List[str] = TextFuzzer(args.seed).texts(args.count)
+        with tempfile.TemporaryDirectory() as tmp:
+            expected: List[Any] = dump_tree(args.against, args.count, args.seed, os.path.join(tmp, "expected.json"))
+            actual: List[Any] = dump_tree(args.tree, args.count, args.seed, os.path.join(tmp, "actual.json"))
+        different_contents: int = 0
+        different_errors: int = 0
+        different_messages: int = 0
+        for text, x, y in zip(texts, expected, actual):
+            if x == y:
+                continue
+            if isinstance(x, dict) and isinstance(y, dict) and x["raised"] == y["raised"]:
+                # Same exception, e.g. IndexError from a tuple rather than a list.
+                different_messages += 1
+                continue
+            if isinstance(x, dict) and isinstance(y, dict):
+                different_errors += 1
+            else:
+                different_contents += 1
+            if different_contents + different_errors <= 20:
+                print("{!r}: {!r:.120} != {!r:.120}".format(text, y, x))
+        print("{} texts: {} with different Contents or raising only in one tree, {} raising different exceptions, "
+              "{} raising the same exception with a different message".format(
+                  len(texts), different_contents, different_errors, different_messages))
+        sys.exit(1 if different_contents or different_errors else 0)
+    else:
+        parser.error("either --dump or --against is required")
@@ -0,0 +1,78 @@
+"""Stand-in AIWolf server that plays the synthetic games of games.py to one client.
+
+    python bench/server.py [--port P] [--idle SECONDS] [--games N] [--role ROLE] [--chunk BYTES]
+
+It prints "ready PORT" once listening, and the number of the responses when the client is done.
+"""
+import json
+import socket
+import threading
+import time
+from argparse import ArgumentParser
+from typing import BinaryIO, List, Optional, Tuple
+
+import games
+
+ANSWERED: Tuple[str, ...] = ("NAME", "ROLE", "TALK", "WHISPER", "VOTE", "ATTACK", "DIVINE", "GUARD")
+
+
+def listen(port: int = 0) -> socket.socket:
+    """A listening socket on localhost; port 0 picks a free port."""
+    server: socket.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    server.bind(("127.0.0.1", port))
+    server.listen(1)
+    return server
+
+
+def serve(server: socket.socket, idle: float = 0.0, game_count: int = 1, n: int = 15, role: str = "VILLAGER",
+          chunk: Optional[int] = None, ready: Optional[threading.Event] = None) -> List[Tuple[str, str]]:
+    """Accept one client and play game_count games with it.
+
+    Args:
+        server: The listening socket.
+        idle: The pause after each packet in seconds, standing for the other agents' turns.
+        game_count: The number of the games.
+        n: The number of the agents.
+        role: The role of the client's player.
+        chunk: If given, each packet is sent in pieces of this many bytes.
+        ready: Set once the server is listening.
+
+    Returns:
+        The requests answered by the client and the responses.
+    """
+    if ready is not None:
+        ready.set()
+    conn: socket.socket = server.accept()[0]
+    reader: BinaryIO = conn.makefile("rb")
+    responses: List[Tuple[str, str]] = []
+    try:
+        for g in range(game_count):
+            for packet in games.game(n=n, role=role, seed=g):
+                data: bytes = (json.dumps(packet, separators=(",", ":")) + "\n").encode()
+                if chunk:
+                    for k in range(0, len(data), chunk):
+                        conn.sendall(data[k:k + chunk])
+                else:
+                    conn.sendall(data)
+                if packet["request"] in ANSWERED:
+                    responses.append((packet["request"], reader.readline().decode().rstrip("\n")))
+                if idle:
+                    time.sleep(idle)
+    finally:
+        conn.close()
+        server.close()
+    return responses
+
+
+if __name__ == "__main__":
+    parser: ArgumentParser = ArgumentParser()
+    parser.add_argument("--port", type=int, default=0)
+    parser.add_argument("--idle", type=float, default=0.0)
+    parser.add_argument("--games", type=int, default=1)
+    parser.add_argument("--role", type=str, default="VILLAGER")
+    parser.add_argument("--chunk", type=int, default=None)
+    args = parser.parse_args()
+    server: socket.socket = listen(args.port)
+    print("ready", server.getsockname()[1], flush=True)
+    print(len(serve(server, args.idle, args.games, role=args.role, chunk=args.chunk)), "responses", flush=True)
@@ -0,0 +1,58 @@
+"""Cost of a full day of a 15-player game to HyunjiVillager.
+
+    python bench/vote_day.py [--tree DIR] [--turns N] [--repeat N]
+
+The packets of day 1 of a synthetic game (DAILY_INITIALIZE, one TALK per talk turn, VOTE and DAILY_FINISH)
+are fed through TcpipClient._get_response to a HyunjiPlayer playing a villager, random seeded,
+with the Content cache disabled and enabled. The other days are fed as well but not timed,
+and the packets are decoded outside the timing.
+"""
+import json
+import random
+import time
+from argparse import ArgumentParser
+from typing import Any, Dict, List
+
+import common
+import games
+
+if __name__ == "__main__":
+    parser: ArgumentParser = ArgumentParser()
+    parser.add_argument("--tree", type=str, default=None)
+    parser.add_argument("--turns", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=15)
+    args = parser.parse_args()
+    common.use_tree(args.tree)
+    common.quiet_agent()
+    from aiwolf import Content, TcpipClient
+    from hyunji_agent import HyunjiPlayer
+
+    cache: Any = getattr(Content, "cache", None) # None in the trees without the cache.
+    lines: List[str] = games.lines(n=15, role="VILLAGER", days=3, turns=args.turns)
+
+    def is_day1(packet: Dict[str, Any]) -> bool:
+        return packet["gameInfo"] is not None and packet["gameInfo"]["day"] == 1
+
+    def day() -> float:
+        random.seed(0)
+        client: TcpipClient = TcpipClient(HyunjiPlayer("bench"), "bench", "", 0, "none")
+        elapsed: float = 0.0
+        for packet in [json.loads(line) for line in lines]:
+            if is_day1(packet):
+                t0: float = time.perf_counter()
+                client._get_response(packet)
+                elapsed += time.perf_counter() - t0
+            else:
+                client._get_response(packet)
+        return elapsed
+
+    day1: List[Dict[str, Any]] = [p for p in map(json.loads, lines) if is_day1(p)]
+    print("day 1: {} packets, {} talks".format(len(day1), max(len(p["gameInfo"]["talkList"]) for p in day1)))
+    for enabled in (False, True):
+        if cache is not None:
+            cache.clear()
+            cache.resize(1024 if enabled else 0)
+        elif enabled:
+            break
+        times: List[float] = sorted(day() for _ in range(args.repeat))
+        print("cache {:<4} {} ms/day (min / median)".format("on" if enabled else "off", common.min_median(times, 1e3)))
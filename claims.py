@@ -0,0 +1,82 @@
+from typing import Dict, List, Tuple
+
+from aiwolf import Agent, AgentSet
+
+EMPTY_AGENTS: List[Agent] = []
+
+
+class Claims:
+    """Index of the claims of one kind, "speaker claims something about target".
+
+    The speakers are kept by target and the targets by speaker, in the order they were talked
+    and with repeats, as the vote candidates are drawn from them. The AgentSets are for membership tests.
+    The returned lists are shared, so they must not be modified.
+    """
+    pairs: List[Tuple[Agent, Agent]] # (speaker, target) in talk order.
+    _speakers: Dict[Agent, List[Agent]] # Speakers by target.
+    _targets: Dict[Agent, List[Agent]] # Targets by speaker.
+    _speaker_sets: Dict[Agent, AgentSet] # Speakers by target.
+    _target_sets: Dict[Agent, AgentSet] # Targets by speaker.
+
+    def __init__(self) -> None:
+        self.pairs = []
+        self._speakers = {}
+        self._targets = {}
+        self._speaker_sets = {}
+        self._target_sets = {}
+
+    def clear(self) -> None:
+        self.pairs.clear()
+        self._speakers.clear()
+        self._targets.clear()
+        self._speaker_sets.clear()
+        self._target_sets.clear()
+
+    def add(self, speaker: Agent, target: Agent) -> None:
+        self.pairs.append((speaker, target))
+        self._speakers.setdefault(target, []).append(speaker)
+        self._targets.setdefault(speaker, []).append(target)
+        self._speaker_sets[target] = self._speaker_sets.get(target, AgentSet()).including(speaker)
+        self._target_sets[speaker] = self._target_sets.get(speaker, AgentSet()).including(target)
+
+    def speakers(self, target: Agent) -> List[Agent]:
+        """Agents that claimed about target, in talk order."""
+        return self._speakers.get(target, EMPTY_AGENTS)
+
+    def targets(self, speaker: Agent) -> List[Agent]:
+        """Agents that speaker claimed about, in talk order."""
+        return self._targets.get(speaker, EMPTY_AGENTS)
+
+    def speaker_set(self, target: Agent) -> AgentSet:
+        """Set of the agents that claimed about target."""
+        return self._speaker_sets.get(target, AgentSet())
+
+    def target_set(self, speaker: Agent) -> AgentSet:
+        """Set of the agents that speaker claimed about."""
+        return self._target_sets.get(speaker, AgentSet())
+
+    def targets_except(self, speakers: AgentSet) -> List[Agent]:
+        """Targets of the claims made by the agents not in speakers, in talk order."""
+        if not speakers:
+            return [t for _, t in self.pairs]
+        return [t for s, t in self.pairs if s not in speakers]
+
+
+class ClaimStore:
+    """Claims found in the talks of the game, filled by update()."""
+    vote: Claims # VOTE target.
+    voted: Claims # VOTED target.
+    request_vote: Claims # REQUEST (VOTE target).
+    divined_werewolf: Claims # DIVINED target WEREWOLF.
+
+    def __init__(self) -> None:
+        self.vote = Claims()
+        self.voted = Claims()
+        self.request_vote = Claims()
+        self.divined_werewolf = Claims()
+
+    def clear(self) -> None:
+        self.vote.clear()
+        self.voted.clear()
+        self.request_vote.clear()
+        self.divined_werewolf.clear()
@@ -1,5 +1,7 @@
-from aiwolf import Content, Judge, SkipContentBuilder
+from aiwolf import Content, EmptyContentBuilder, Judge, SkipContentBuilder
 
 CONTENT_SKIP: Content = Content(SkipContentBuilder())
 
+CONTENT_EMPTY: Content = Content(EmptyContentBuilder())
+
 JUDGE_EMPTY: Judge = Judge()
@@ -47,6 +47,9 @@ class HyunjiPlayer(AbstractPlayer):
     def finish(self) -> None:
         self.player.finish()
 
+    def get_vote_candidate(self) -> Agent:
+        return self.player.get_vote_candidate()
+
     def guard(self) -> Agent:
         return self.player.guard()
 
@@ -87,6 +90,9 @@ if __name__ == "__main__":
     parser.add_argument("-h", type=str, action="store", dest="hostname", required=True)
     parser.add_argument("-r", type=str, action="store", dest="role", default="none")
     parser.add_argument("-n", type=str, action="store", dest="name", default=myname)
+    # Share of the time limit a decision may take before a fallback is sent, off by default (see start.py).
+    parser.add_argument("-t", type=float, action="store", dest="time_budget", default=None)
     input_args = parser.parse_args()
     
-    TcpipClient(agent, input_args.name, input_args.hostname, input_args.port, input_args.role).connect()
+    TcpipClient(agent, input_args.name, input_args.hostname, input_args.port, input_args.role,
+                time_budget=input_args.time_budget).connect()
@@ -0,0 +1,72 @@
+from bisect import bisect_left, insort
+from typing import Dict, List, Tuple
+
+
+class InteractionGraph:
+    """Links "speaker talked to target" and the reciprocal pairs among them.
+
+    A reciprocal pair is a link S and a link T in the opposite direction with S.day <= T.day and S.idx < T.idx,
+    where idx is the index of the talk in its day. The pairs are counted as the links are added,
+    so the counts can be read at any time.
+    """
+    links: List[List[int]] # [speaker, target, day, idx] in the order added.
+    count: int # Number of the reciprocal pairs.
+    _buckets: Dict[Tuple[int, int], List[Tuple[int, int]]] # (day, idx) of the links by (speaker, target).
+    _sorted_idx: Dict[Tuple[int, int], List[int]] # Sorted idx of the links by (speaker, target).
+    _pair_counts: Dict[Tuple[int, int], int] # Reciprocal pairs by (smaller agent, larger agent).
+    _day_counts: Dict[int, int] # Reciprocal pairs by the day of T.
+    _last: Tuple[int, int] # Largest (day, idx) added so far.
+
+    def __init__(self) -> None:
+        self.links = []
+        self._buckets = {}
+        self._sorted_idx = {}
+        self._pair_counts = {}
+        self._day_counts = {}
+        self.clear()
+
+    def clear(self) -> None:
+        self.links.clear()
+        self.count = 0
+        self._buckets.clear()
+        self._sorted_idx.clear()
+        self._pair_counts.clear()
+        self._day_counts.clear()
+        self._last = (-1, -1)
+
+    def add(self, speaker: int, target: int, day: int, idx: int) -> None:
+        """Add the link and count the reciprocal pairs it makes with the links added before."""
+        self.links.append([speaker, target, day, idx])
+        reverse: List[Tuple[int, int]] = self._buckets.get((target, speaker), [])
+        if (day, idx) >= self._last:
+            # Talks come in order, so the new link can only be T: every earlier reverse link has day <= this day.
+            self._last = (day, idx)
+            n: int = bisect_left(self._sorted_idx[(target, speaker)], idx) if reverse else 0
+            if n:
+                self._add_pairs(speaker, target, day, n)
+        else:
+            for d, i in reverse:
+                if d <= day and i < idx:
+                    self._add_pairs(speaker, target, day, 1)
+                elif day <= d and idx < i:
+                    self._add_pairs(speaker, target, d, 1)
+        self._buckets.setdefault((speaker, target), []).append((day, idx))
+        insort(self._sorted_idx.setdefault((speaker, target), []), idx)
+
+    def _add_pairs(self, a: int, b: int, day: int, n: int) -> None:
+        self.count += n
+        key: Tuple[int, int] = (a, b) if a < b else (b, a)
+        self._pair_counts[key] = self._pair_counts.get(key, 0) + n
+        self._day_counts[day] = self._day_counts.get(day, 0) + n
+
+    def pair_count(self, a: int, b: int) -> int:
+        """Number of the reciprocal pairs between agents a and b."""
+        return self._pair_counts.get((a, b) if a < b else (b, a), 0)
+
+    def day_count(self, day: int) -> int:
+        """Number of the reciprocal pairs completed on the day."""
+        return self._day_counts.get(day, 0)
+
+    def link_count(self, speaker: int, target: int) -> int:
+        """Number of the links from speaker to target."""
+        return len(self._buckets.get((speaker, target), ()))
@@ -1,9 +1,8 @@
 from collections import deque
 from typing import Deque, List, Optional
 
-from aiwolf import (Agent, ComingoutContentBuilder, Content, GameInfo,
-                    GameSetting, IdentContentBuilder, Judge, Role, Species,
-                    Vote, VoteContentBuilder)
+from aiwolf import (Agent, Content, GameInfo, GameSetting, Judge, Role, Species,
+                    Vote)
 from aiwolf.constant import AGENT_NONE
 
 from const import CONTENT_SKIP
@@ -52,21 +51,20 @@ class HyunjiMedium(HyunjiVillager):
         # Do comingout if it's on scheduled day or a werewolf is found.
         if not self.has_co and (self.game_info.day == self.co_date or self.found_wolf):
             self.has_co = True
-            return Content(ComingoutContentBuilder(self.me, Role.MEDIUM))
+            return self.responses.comingout(Role.MEDIUM)
         # Report the medium result after doing comingout.
         if self.has_co and self.my_judge_queue:
             judge: Judge = self.my_judge_queue.popleft()
-            return Content(IdentContentBuilder(judge.target, judge.result))
+            return self.responses.identified(judge.target, judge.result)
         # The list of agents that voted for me in the last turn.
-        voted_for_me: List[Agent] = [j.agent for j in self.voted_reports if j.target == self.me]
+        voted_for_me: List[Agent] = self.claims.voted.speakers(self.me)
         # The list of agents that said they would vote for me.
-        vote_talk_for_me: List[Agent] = [j.agent for j in self.vote_talk if j.target == self.me]
+        vote_talk_for_me: List[Agent] = self.claims.vote.speakers(self.me)
         # The list of agents that requested to vote for me.
-        request_vote_for_me: List[Agent] = [j.agent for j in self.request_vote_talk if j.target == self.me]
+        request_vote_for_me: List[Agent] = self.claims.request_vote.speakers(self.me)
         # The list of fake seers that reported me as a werewolf.
         # Fake seers.
-        fake_seers: List[Agent] = [j.agent for j in self.divination_reports
-                                   if j.target == self.me and j.result == Species.WEREWOLF]
+        fake_seers: List[Agent] = self.claims.divined_werewolf.speakers(self.me)
         # Vote for one of the alive fake mediums.
         candidates: List[Agent] = [a for a in self.comingout_map
                                    if self.is_alive(a) and self.comingout_map[a] == Role.MEDIUM]
@@ -82,8 +80,8 @@ class HyunjiMedium(HyunjiVillager):
             candidates = self.get_alive_others(request_vote_for_me)
         # Vote for one of the alive agents that were judged as werewolves by non-fake seers
         if not candidates:
-            reported_wolves: List[Agent] = [j.target for j in self.divination_reports
-                                            if j.agent not in fake_seers and j.result == Species.WEREWOLF]
+            reported_wolves: List[Agent] = self.claims.divined_werewolf.targets_except(
+                self.claims.divined_werewolf.speaker_set(self.me))
             candidates = self.get_alive_others(reported_wolves)
         # Vote for one of the alive fake seers if there are no candidates.
         if not candidates:
@@ -95,5 +93,5 @@ class HyunjiMedium(HyunjiVillager):
         if self.vote_candidate == AGENT_NONE or self.vote_candidate not in candidates:
             self.vote_candidate = self.random_select(candidates)
             if self.vote_candidate != AGENT_NONE:
-                return Content(VoteContentBuilder(self.vote_candidate))
+                return self.responses.vote(self.vote_candidate)
         return CONTENT_SKIP
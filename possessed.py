@@ -2,13 +2,12 @@ import random
 from collections import deque
 from typing import Deque, List
 
-from aiwolf import (Agent, ComingoutContentBuilder, Content, Talk, Topic, Operator,
-                    DivinedResultContentBuilder, GameInfo, GameSetting,
-                    IdentContentBuilder, Judge, Role, Species, Vote, Status, DivinationContentBuilder,
-                    VoteContentBuilder, ContentBuilder, EstimateContentBuilder, RequestContentBuilder, EmptyContentBuilder)
-from aiwolf.constant import AGENT_NONE, AGENT_ANY, AGENT_UNSPEC
+from aiwolf import (Agent, AgentSet, Content, Talk, Topic, Operator,
+                    GameInfo, GameSetting,
+                    Judge, Role, Species, Vote, Status, DivinationContentBuilder)
+from aiwolf.constant import AGENT_NONE, AGENT_UNSPEC
 
-from const import CONTENT_SKIP, JUDGE_EMPTY
+from const import CONTENT_EMPTY, CONTENT_SKIP, JUDGE_EMPTY
 from villager import HyunjiVillager
 from analyzer import Analyzer
 
@@ -26,8 +25,8 @@ class HyunjiPossessed(HyunjiVillager):
     voted_reports: List[Vote] # Time series of voting reports.
     request_vote_talk: List[Vote] # Talk containing REQUEST VOTE.
     co_seers_others: List[Agent]
-    sit1_talk: ContentBuilder
-    sit2_talk: ContentBuilder
+    sit1_talk: Content
+    sit2_talk: Content
 
     def __init__(self, agent_name) -> None:
         super().__init__(agent_name)
@@ -98,7 +97,7 @@ class HyunjiPossessed(HyunjiVillager):
         if not self.has_first_co and self.game_info.day == 1:
             self.has_first_co = True
             self.random_co_role: Role = random.choice([Role.SEER, Role.VILLAGER])
-            return Content(ComingoutContentBuilder(self.me, self.random_co_role))
+            return self.responses.comingout(self.random_co_role)
         
         self.co_seers_others: List[Agent] = self.get_alive_others([a for a in self.comingout_map
                                          if self.comingout_map[a] == Role.SEER])
@@ -106,69 +105,72 @@ class HyunjiPossessed(HyunjiVillager):
         if self.random_co_role == Role.VILLAGER:
             if len(self.co_seers_others) >= 1:
                 co_seers_other = self.random_select(self.co_seers_others)
-                self.sit1_talk: ContentBuilder = random.choice([RequestContentBuilder(AGENT_ANY, Content(VoteContentBuilder(co_seers_other))),
-                                                      EstimateContentBuilder(co_seers_other, Role.WEREWOLF),
-                                                      EmptyContentBuilder()])
-                return Content(self.sit1_talk)
+                self.sit1_talk: Content = random.choice([self.responses.request_vote(co_seers_other),
+                                                         self.responses.estimate(co_seers_other, Role.WEREWOLF),
+                                                         CONTENT_EMPTY])
+                return self.sit1_talk
         # Situation 2: I CO SEER
         elif self.random_co_role == Role.SEER:
             if len(self.co_seers_others) >= 1:
                 co_seers_other = self.random_select(self.co_seers_others)
-                self.sit2_talk: ContentBuilder = random.choice([EstimateContentBuilder(co_seers_other, Role.WEREWOLF),
-                                                           RequestContentBuilder(AGENT_ANY, Content(VoteContentBuilder(co_seers_other))),
-                                                           DivinedResultContentBuilder(co_seers_other, Species.WEREWOLF),
-                                                           EmptyContentBuilder()])
-                return Content(self.sit2_talk)
+                self.sit2_talk: Content = random.choice([self.responses.estimate(co_seers_other, Role.WEREWOLF),
+                                                         self.responses.request_vote(co_seers_other),
+                                                         self.responses.divined(co_seers_other, Species.WEREWOLF),
+                                                         CONTENT_EMPTY])
+                return self.sit2_talk
         
         # Do comingout if it's on scheduled day or a werewolf is found.
         if self.fake_role != Role.VILLAGER and not self.has_co \
                 and (self.game_info.day == self.co_date or self.werewolves):
             self.has_co = True
-            return Content(ComingoutContentBuilder(self.me, self.fake_role))
+            return self.responses.comingout(self.fake_role)
         
         # Report the judgement after doing comingout.
         if self.has_co and self.my_judgee_queue:
             judge: Judge = self.my_judgee_queue.popleft()
             if self.fake_role == Role.SEER:
-                return Content(DivinedResultContentBuilder(judge.target, judge.result))
+                return self.responses.divined(judge.target, judge.result)
             elif self.fake_role == Role.MEDIUM:
-                return Content(IdentContentBuilder(judge.target, judge.result))
+                return self.responses.identified(judge.target, judge.result)
         
         self.vote_candidate = self.vote()
         rnd = random.randint(0, 2)
         # Declare which to vote for if not declare yet or the candidate is changed.
         if self.vote_candidate != AGENT_NONE and rnd == 0:
-            return Content(VoteContentBuilder(self.vote_candidate))
+            return self.responses.vote(self.vote_candidate)
         return CONTENT_SKIP
     
     def vote(self) -> Agent:
         # The list of agents that voted for me in the last turn.
-        voted_for_me: List[Agent] = [j.agent for j in self.voted_reports if j.target == self.me]
+        voted_for_me: List[Agent] = self.claims.voted.speakers(self.me)
         # The list of agents that said they would vote for me.
-        vote_talk_for_me: List[Agent] = [j.agent for j in self.vote_talk if j.target == self.me]
+        vote_talk_for_me: List[Agent] = self.claims.vote.speakers(self.me)
         # The list of agents that requested to vote for me.
-        request_vote_for_me: List[Agent] = [j.agent for j in self.request_vote_talk if j.target == self.me]
+        request_vote_for_me: List[Agent] = self.claims.request_vote.speakers(self.me)
         # The list of fake seers that reported me as a werewolf.
-        fake_seers: List[Agent] = [j.agent for j in self.divination_reports
-                                if j.target == self.me and j.result == Species.WEREWOLF]  
+        fake_seers: List[Agent] = self.claims.divined_werewolf.speakers(self.me)
         
         # Vote for one of the alive agents that can vote for me this turn.
         candidates: List[Agent] = self.get_alive_others(vote_talk_for_me) 
+        addable: AgentSet = self.game_info.alive_agents - AgentSet(candidates) # Alive agents not in candidates yet.
         for i in range(self.talk_list_head, len(self.game_info.talk_list)): # Analyze talks that have not been analyzed yet.
             tk: Talk = self.game_info.talk_list[i]  # The talk to be analyzed.
             content: Content = Content.compile(tk.text)
             talker: Agent = tk.agent
             if content.topic == Topic.ESTIMATE and content.role == Role.WEREWOLF and content.target == self.me:
-                if talker not in candidates and self.is_alive(talker):
+                if talker in addable:
                         candidates.append(talker)
+                        addable = addable.excluding(talker)
             if content.topic == Topic.ESTIMATE and content.role == Role.SEER and content.target == self.me:
-                if talker not in candidates and self.is_alive(talker):
+                if talker in addable:
                         candidates.append(talker)
+                        addable = addable.excluding(talker)
             if content.topic == Topic.OPERATOR and content.operator == Operator.REQUEST:
                 for contents in content.content_list:
                     if contents.topic == Topic.VOTE and contents.target == self.me:
-                        if talker not in candidates and self.is_alive(talker):
+                        if talker in addable:
                             candidates.append(talker)
+                            addable = addable.excluding(talker)
      
         # Vote for one of the alive agents that requested to vote for me this turn.
         if not candidates:
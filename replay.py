@@ -0,0 +1,18 @@
+from argparse import ArgumentParser
+
+from aiwolf.replay import replay
+
+from hyunji_agent import HyunjiPlayer
+from analyzer import Analyzer
+
+if __name__ == "__main__":
+    parser: ArgumentParser = ArgumentParser()
+    parser.add_argument("record", type=str, help="gzip file recorded with the -o option of start.py")
+    parser.add_argument("-n", type=str, action="store", dest="name", default="KimAgent")
+    parser.add_argument("-r", type=str, action="store", dest="role", default="none")
+    # The seed of random, by default the one stored in the record.
+    parser.add_argument("-s", type=int, action="store", dest="seed", default=None)
+    input_args = parser.parse_args()
+
+    Analyzer.debug_mode = False
+    print(replay(input_args.record, HyunjiPlayer(input_args.name), input_args.name, input_args.role, input_args.seed))
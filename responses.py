@@ -0,0 +1,79 @@
+from typing import Dict, List, Tuple
+
+from aiwolf import (Agent, BecauseContentBuilder, ComingoutContentBuilder, Content,
+                    DivinedResultContentBuilder, EstimateContentBuilder, IdentContentBuilder,
+                    RequestContentBuilder, Role, Species, VoteContentBuilder)
+from aiwolf.constant import AGENT_ANY
+
+
+class ResponseTable:
+    """Table of the Contents the agent utters, built once per game.
+
+    Content is immutable, so the same instance can be returned by every talk().
+    Agents missing from the table (not in the game) get a Content built on the spot.
+    """
+    me: Agent # Myself.
+    _vote: Dict[Agent, Content] # VOTE agent.
+    _request_vote: Dict[Agent, Content] # REQUEST ANY (VOTE agent).
+    _comingout: Dict[Role, Content] # COMINGOUT me role.
+    _estimate: Dict[Tuple[Agent, Role], Content] # ESTIMATE agent role.
+    _divined: Dict[Tuple[Agent, Species], Content] # DIVINED agent species.
+    _identified: Dict[Tuple[Agent, Species], Content] # IDENTIFIED agent species.
+    _because_wolf_vote: Dict[Agent, Content] # BECAUSE (ESTIMATE agent WEREWOLF) (REQUEST ANY (VOTE agent)).
+    _because_seer_wolf: Dict[Agent, Content] # BECAUSE (COMINGOUT me SEER) (ESTIMATE agent WEREWOLF).
+
+    roles: Tuple[Role, ...] = (Role.VILLAGER, Role.SEER, Role.MEDIUM, Role.BODYGUARD, Role.POSSESSED, Role.WEREWOLF)
+    species: Tuple[Species, ...] = (Species.HUMAN, Species.WEREWOLF)
+
+    def __init__(self, me: Agent, agent_list: List[Agent]) -> None:
+        self.me = me
+        self._vote = {a: Content(VoteContentBuilder(a)) for a in agent_list}
+        self._request_vote = {a: Content(RequestContentBuilder(AGENT_ANY, self._vote[a])) for a in agent_list}
+        self._comingout = {r: Content(ComingoutContentBuilder(me, r)) for r in self.roles}
+        self._estimate = {(a, r): Content(EstimateContentBuilder(a, r)) for a in agent_list for r in (Role.WEREWOLF, Role.SEER)}
+        self._divined = {(a, s): Content(DivinedResultContentBuilder(a, s)) for a in agent_list for s in self.species}
+        self._identified = {(a, s): Content(IdentContentBuilder(a, s)) for a in agent_list for s in self.species}
+        self._because_wolf_vote = {a: Content(BecauseContentBuilder(self.estimate(a, Role.WEREWOLF), self._request_vote[a]))
+                                   for a in agent_list}
+        self._because_seer_wolf = {a: Content(BecauseContentBuilder(self.comingout(Role.SEER), self.estimate(a, Role.WEREWOLF)))
+                                   for a in agent_list}
+
+    def vote(self, agent: Agent) -> Content:
+        """VOTE agent."""
+        c = self._vote.get(agent)
+        return c if c is not None else Content(VoteContentBuilder(agent))
+
+    def request_vote(self, agent: Agent) -> Content:
+        """REQUEST ANY (VOTE agent)."""
+        c = self._request_vote.get(agent)
+        return c if c is not None else Content(RequestContentBuilder(AGENT_ANY, self.vote(agent)))
+
+    def comingout(self, role: Role) -> Content:
+        """COMINGOUT me role."""
+        c = self._comingout.get(role)
+        return c if c is not None else Content(ComingoutContentBuilder(self.me, role))
+
+    def estimate(self, agent: Agent, role: Role) -> Content:
+        """ESTIMATE agent role."""
+        c = self._estimate.get((agent, role))
+        return c if c is not None else Content(EstimateContentBuilder(agent, role))
+
+    def divined(self, agent: Agent, result: Species) -> Content:
+        """DIVINED agent result."""
+        c = self._divined.get((agent, result))
+        return c if c is not None else Content(DivinedResultContentBuilder(agent, result))
+
+    def identified(self, agent: Agent, result: Species) -> Content:
+        """IDENTIFIED agent result."""
+        c = self._identified.get((agent, result))
+        return c if c is not None else Content(IdentContentBuilder(agent, result))
+
+    def because_wolf_vote(self, agent: Agent) -> Content:
+        """BECAUSE (ESTIMATE agent WEREWOLF) (REQUEST ANY (VOTE agent))."""
+        c = self._because_wolf_vote.get(agent)
+        return c if c is not None else Content(BecauseContentBuilder(self.estimate(agent, Role.WEREWOLF), self.request_vote(agent)))
+
+    def because_seer_wolf(self, agent: Agent) -> Content:
+        """BECAUSE (COMINGOUT me SEER) (ESTIMATE agent WEREWOLF)."""
+        c = self._because_seer_wolf.get(agent)
+        return c if c is not None else Content(BecauseContentBuilder(self.comingout(Role.SEER), self.estimate(agent, Role.WEREWOLF)))
@@ -2,14 +2,12 @@ from collections import deque
 import random
 from typing import Deque, List, Optional
 
-from aiwolf import (Agent, ComingoutContentBuilder, Content, ContentBuilder, Topic,
-                    DivinedResultContentBuilder, GameInfo, GameSetting, Judge,
-                    Role, Species, Vote, VoteContentBuilder, RequestContentBuilder, 
-                    EstimateContentBuilder, EmptyContentBuilder, BecauseContentBuilder, )
-from aiwolf.constant import AGENT_NONE, AGENT_ANY
+from aiwolf import (Agent, Content, Topic, GameInfo, GameSetting, Judge,
+                    Role, Species, Vote)
+from aiwolf.constant import AGENT_NONE
 from aiwolf.utterance import UtteranceType, Talk
 
-from const import CONTENT_SKIP
+from const import CONTENT_EMPTY, CONTENT_SKIP
 from villager import HyunjiVillager
 from analyzer import Analyzer
 
@@ -28,8 +26,8 @@ class HyunjiSeer(HyunjiVillager):
     random_co_role: Role
     co_villagers: List[Agent]
     fake_seers: List[Agent]
-    sit1_talk: ContentBuilder
-    sit2_talk: ContentBuilder
+    sit1_talk: Content
+    sit2_talk: Content
 
     def __init__(self, agent_name) -> None:
         super().__init__(agent_name)
@@ -78,52 +76,52 @@ class HyunjiSeer(HyunjiVillager):
         if not self.has_first_co and self.game_info.day == 1:
             self.has_first_co = True
             self.random_co_role: Role = random.choice([Role.SEER, Role.VILLAGER])
-            return Content(ComingoutContentBuilder(self.me, self.random_co_role))
+            return self.responses.comingout(self.random_co_role)
         self.fake_seers: List[Agent] = self.get_alive_others([a for a in self.comingout_map
                                          if self.comingout_map[a] == Role.SEER])
         # Situation 1: No real seer among CO SEER
         if self.random_co_role == Role.VILLAGER:
             if len(self.fake_seers) >= 1:
                 fake_seer = self.random_select(self.fake_seers)
-                self.sit1_talk: ContentBuilder = random.choice([BecauseContentBuilder(Content(EstimateContentBuilder(fake_seer, Role.WEREWOLF)), Content(RequestContentBuilder(AGENT_ANY, Content(VoteContentBuilder(fake_seer))))),
-                                                      EstimateContentBuilder(fake_seer, Role.WEREWOLF),
-                                                      EmptyContentBuilder()])
-                return Content(self.sit1_talk)
+                self.sit1_talk: Content = random.choice([self.responses.because_wolf_vote(fake_seer),
+                                                         self.responses.estimate(fake_seer, Role.WEREWOLF),
+                                                         CONTENT_EMPTY])
+                return self.sit1_talk
         # Situation 2: I am the real seer among CO SEER
         elif self.random_co_role == Role.SEER:
             self.has_co = True
             if len(self.fake_seers) >= 1:
                 fake_seer = self.random_select(self.fake_seers)
-                self.sit2_talk: ContentBuilder = random.choice([BecauseContentBuilder(Content(ComingoutContentBuilder(self.me, Role.SEER)), Content(EstimateContentBuilder(fake_seer, Role.WEREWOLF))),
-                                                           EstimateContentBuilder(fake_seer, Role.SEER),
-                                                           BecauseContentBuilder(Content(EstimateContentBuilder(fake_seer, Role.WEREWOLF)), Content(RequestContentBuilder(AGENT_ANY, Content(VoteContentBuilder(fake_seer))))),
-                                                           EmptyContentBuilder()])
-                return Content(self.sit2_talk)
+                self.sit2_talk: Content = random.choice([self.responses.because_seer_wolf(fake_seer),
+                                                         self.responses.estimate(fake_seer, Role.SEER),
+                                                         self.responses.because_wolf_vote(fake_seer),
+                                                         CONTENT_EMPTY])
+                return self.sit2_talk
               
         # Do comingout if it's on scheduled day or a werewolf is found.
         if not self.has_co and (self.game_info.day == self.co_date or self.werewolves):
             self.has_co = True
-            return Content(ComingoutContentBuilder(self.me, Role.SEER))
+            return self.responses.comingout(Role.SEER)
         
         # Report the divination result after doing comingout.
         if self.has_co and self.my_judge_queue:
             judge: Judge = self.my_judge_queue.popleft()
-            return Content(DivinedResultContentBuilder(judge.target, judge.result))
+            return self.responses.divined(judge.target, judge.result)
 
         self.vote_candidate = self.vote()
         rnd = random.randint(0, 2)
         # Declare which to vote for if not declare yet or the candidate is changed.
         if self.vote_candidate != AGENT_NONE and rnd == 0:
-            return Content(VoteContentBuilder(self.vote_candidate))
+            return self.responses.vote(self.vote_candidate)
         return CONTENT_SKIP
 
     def vote(self) -> Agent:
         # The list of agents that voted for me in the last turn.
-        voted_for_me: List[Agent] = [j.agent for j in self.voted_reports if j.target == self.me]
+        voted_for_me: List[Agent] = self.claims.voted.speakers(self.me)
         # The list of agents that said they would vote for me.
-        vote_talk_for_me: List[Agent] = [j.agent for j in self.vote_talk if j.target == self.me]
+        vote_talk_for_me: List[Agent] = self.claims.vote.speakers(self.me)
         # The list of agents that requested to vote for me.
-        request_vote_for_me: List[Agent] = [j.agent for j in self.request_vote_talk if j.target == self.me]        
+        request_vote_for_me: List[Agent] = self.claims.request_vote.speakers(self.me)
         # Vote for one of the alive werewolves.
         candidates: List[Agent] = self.get_alive(self.werewolves)
         # Vote for one of the alive fake seers if there are no candidates.
@@ -1,11 +1,11 @@
 import warnings
 from argparse import ArgumentParser
 
-from aiwolf import AbstractPlayer, TcpipClient
+from aiwolf import AbstractPlayer, AsyncTcpipClient, TcpipClient
 
 from hyunji_agent import HyunjiPlayer
 from analyzer import Analyzer
-from random import randint
+from random import randint, randrange, seed
 from read_log import read_log
 
 if __name__ == "__main__":
@@ -15,6 +15,29 @@ if __name__ == "__main__":
     parser.add_argument("-h", type=str, action="store", dest="hostname", required=True)
     parser.add_argument("-r", type=str, action="store", dest="role", default="none")
     parser.add_argument("-n", type=str, action="store", dest="name", required=True)
+    parser.add_argument("-c", type=int, action="store", dest="count", default=1)
+    parser.add_argument("-o", type=str, action="store", dest="record", default=None)
+    parser.add_argument("-s", type=int, action="store", dest="seed", default=None)
+    # Share of the time limit a decision may take before a fallback is sent, e.g. 0.8. Off by default:
+    # with it, every packet is handled in one daemon thread shared by all the players of the process,
+    # and a player that overruns its deadline delays the packets after it.
+    parser.add_argument("-t", type=float, action="store", dest="time_budget", default=None)
     input_args = parser.parse_args()
+    if input_args.record is not None and input_args.count > 1:
+        # The players of one process share random, so the game of one of them could not be replayed alone.
+        parser.error("-o records a single client and cannot be combined with -c greater than 1")
 
-    TcpipClient(agent, input_args.name, input_args.hostname, input_args.port, input_args.role).connect()
+    # A recorded game always gets a seed, stored in the record, so that replay.py can reproduce it.
+    random_seed = input_args.seed if input_args.seed is not None or input_args.record is None else randrange(2 ** 31)
+    if random_seed is not None:
+        seed(random_seed)
+
+    if input_args.count > 1:
+        # Host several players over separate connections in one event loop.
+        AsyncTcpipClient.run_all([AsyncTcpipClient(HyunjiPlayer('KimAgent'), input_args.name + "{:02d}".format(i + 1),
+                                                   input_args.hostname, input_args.port, input_args.role,
+                                                   time_budget=input_args.time_budget)
+                                  for i in range(input_args.count)])
+    else:
+        TcpipClient(agent, input_args.name, input_args.hostname, input_args.port, input_args.role,
+                    time_budget=input_args.time_budget, record_path=input_args.record, record_seed=random_seed).connect()
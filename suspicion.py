@@ -0,0 +1,118 @@
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from aiwolf import Agent, Content, Operator, Role, Species, Talk, Topic, Utterance
+
+try:
+    import numpy
+except ImportError:
+    numpy = None  # type: ignore
+
+# Interaction types, the first axis of the count matrices.
+ESTIMATE_WOLF: int = 0 # ESTIMATE target WEREWOLF.
+VOTE: int = 1 # VOTE target.
+REQUEST_VOTE: int = 2 # REQUEST (VOTE target).
+DIVINED_WOLF: int = 3 # DIVINED target WEREWOLF.
+AGREE: int = 4 # AGREE with a talk of target.
+DISAGREE: int = 5 # DISAGREE with a talk of target.
+TYPES: int = 6
+
+# Suspicion added to the target of each interaction type.
+DEFAULT_WEIGHTS: Tuple[float, ...] = (1.0, 0.5, 0.5, 2.0, -0.25, 0.25)
+
+
+class SuspicionEngine:
+    """Per-day count matrices of the interactions in talks, and suspicion scores computed from them.
+
+    counts[day][type, speaker, target] is the number of the interactions of the type on the day.
+    The scores are the weighted sums of the interactions each agent received over the game.
+    They are recomputed only after new interactions, so reading them costs a few microseconds.
+    NumPy is required; available() tells whether it is installed.
+    """
+    size: int # Matrix size, the largest agent index + 1.
+    weights: "numpy.ndarray" # Weight of each interaction type.
+    counts: Dict[int, "numpy.ndarray"] # (TYPES, size, size) counts by day.
+    totals: "numpy.ndarray" # (TYPES, size, size) counts of the whole game.
+    _speakers: Dict[Tuple[int, int], int] # Speaker by (day, idx) of the talk, for AGREE and DISAGREE.
+    _scores: Optional["numpy.ndarray"] # Cached scores, None after new interactions.
+
+    @staticmethod
+    def available() -> bool:
+        return numpy is not None
+
+    def __init__(self, agent_list: Iterable[Agent], weights: Tuple[float, ...] = DEFAULT_WEIGHTS) -> None:
+        self.size = max((a.agent_idx for a in agent_list), default=0) + 1
+        self.weights = numpy.array(weights, dtype=numpy.float64)
+        self.counts = {}
+        self.totals = numpy.zeros((TYPES, self.size, self.size), dtype=numpy.int32)
+        self._speakers = {}
+        self._scores = None
+
+    def add(self, kind: int, day: int, speaker: Agent, target: Agent) -> None:
+        """Count an interaction of the kind from speaker to target."""
+        s: int = speaker.agent_idx
+        t: int = target.agent_idx
+        if s >= self.size or t >= self.size: # ANY and the agents not in the game.
+            return
+        day_counts: Optional[numpy.ndarray] = self.counts.get(day)
+        if day_counts is None:
+            day_counts = self.counts[day] = numpy.zeros((TYPES, self.size, self.size), dtype=numpy.int32)
+        day_counts[kind, s, t] += 1
+        self.totals[kind, s, t] += 1
+        self._scores = None
+
+    def add_talk(self, day: int, idx: int, speaker: Agent, content: Content) -> None:
+        """Count the interactions in a talk."""
+        self._speakers[(day, idx)] = speaker.agent_idx
+        if content.topic == Topic.ESTIMATE and content.role == Role.WEREWOLF:
+            self.add(ESTIMATE_WOLF, day, speaker, content.target)
+        elif content.topic == Topic.VOTE:
+            self.add(VOTE, day, speaker, content.target)
+        elif content.topic == Topic.DIVINED and content.result == Species.WEREWOLF:
+            self.add(DIVINED_WOLF, day, speaker, content.target)
+        elif content.topic == Topic.OPERATOR and content.operator == Operator.REQUEST:
+            for c in content.content_list:
+                if c.topic == Topic.VOTE:
+                    self.add(REQUEST_VOTE, day, speaker, c.target)
+        elif content.topic == Topic.AGREE or content.topic == Topic.DISAGREE:
+            utterance: Utterance = content.utterance
+            if isinstance(utterance, Talk):
+                # The parser keeps the day of the referred talk in idx and its ID in day.
+                target: Optional[int] = self._speakers.get((utterance.idx, utterance.day))
+                if target is not None:
+                    self.add(AGREE if content.topic == Topic.AGREE else DISAGREE, day, speaker, Agent(target))
+
+    def received(self, kind: int, day: Optional[int] = None) -> "numpy.ndarray":
+        """Number of the interactions of the kind each agent received, on the day or over the game."""
+        matrix: numpy.ndarray = self.totals if day is None else self.counts.get(day, numpy.zeros_like(self.totals))
+        return matrix[kind].sum(axis=0)
+
+    def sent(self, kind: int, day: Optional[int] = None) -> "numpy.ndarray":
+        """Number of the interactions of the kind each agent made, on the day or over the game."""
+        matrix: numpy.ndarray = self.totals if day is None else self.counts.get(day, numpy.zeros_like(self.totals))
+        return matrix[kind].sum(axis=1)
+
+    def scores(self) -> "numpy.ndarray":
+        """Suspicion score of each agent index. The array is shared, so it must not be modified."""
+        if self._scores is None:
+            # (TYPES,) . (TYPES, size) -> (size,)
+            self._scores = self.weights @ self.totals.sum(axis=1)
+        return self._scores
+
+    def score(self, agent: Agent) -> float:
+        """Suspicion score of the agent."""
+        scores: numpy.ndarray = self.scores()
+        return float(scores[agent.agent_idx]) if agent.agent_idx < self.size else 0.0
+
+    def most_suspicious(self, candidates: List[Agent]) -> Optional[Agent]:
+        """The candidate with the highest score, the first one on ties. None if there are no candidates.
+
+        As in score(), ANY and the agents not in the game score 0.
+        """
+        if not candidates:
+            return None
+        scores: numpy.ndarray = self.scores()
+        idx: numpy.ndarray = numpy.fromiter((a.agent_idx for a in candidates), dtype=numpy.intp, count=len(candidates))
+        in_game: numpy.ndarray = idx < self.size
+        candidate_scores: numpy.ndarray = numpy.zeros(len(candidates), dtype=scores.dtype)
+        candidate_scores[in_game] = scores[idx[in_game]]
+        return candidates[int(numpy.argmax(candidate_scores))]
@@ -1,17 +1,25 @@
 import random
-from typing import Dict, List
+from typing import ClassVar, Dict, List, Optional, Tuple
 from collections import defaultdict
 
 
-from aiwolf import (AbstractPlayer, Agent, Content, GameInfo, GameSetting,
-                    Judge, Role, Species, Status, Talk, Topic, Vote, Operator, 
-                    VoteContentBuilder, ComingoutContentBuilder, InquiryContentBuilder
+from aiwolf import (AbstractPlayer, Agent, AgentSet, Content, GameInfo, GameSetting,
+                    Judge, Role, Species, Talk, Topic, Vote, Operator, 
+                    InquiryContentBuilder
                     )
 from aiwolf.constant import AGENT_NONE, AGENT_ANY
 from analyzer import Analyzer
+from archive import TalkArchive
+from claims import ClaimStore
+from interaction import InteractionGraph
 from const import CONTENT_SKIP
+from responses import ResponseTable
+from suspicion import SuspicionEngine
 
 class HyunjiVillager(AbstractPlayer):
+    # Build the SuspicionEngine and feed it every talk. Its scores are not used by any decision yet,
+    # so it is off by default to keep update() cheap; set it for analysis (NumPy is needed as well).
+    use_suspicion: ClassVar[bool] = False
     me: Agent # Myself.
     game_info: GameInfo # Information about current game.
     game_setting: GameSetting # Settings of current game.
@@ -24,15 +32,22 @@ class HyunjiVillager(AbstractPlayer):
     vote_talk: List[Vote] # Talk containing VOTE.
     voted_reports: List[Vote] # Time series of voting reports.
     request_vote_talk: List[Vote] # Talk containing REQUEST VOTE.
+    claims: ClaimStore # VOTE, VOTED, REQUEST VOTE and DIVINED WEREWOLF talks indexed by target and by speaker.
     talk_list_head: int # Index of the talk to be analyzed next.
     content_list: List[Content]
     will_vote_reports: Dict[Agent, Agent] 
-    talk_list_all: List[Talk] # List of all talks
+    talk_list_all: List[Talk] # List of all talks (archive.talks)
+    archive: TalkArchive # All talks of the game in columns.
     talk_turn: int # Turn of the talks
     has_first_co: bool
     talk_len: int
-    interaction_link: List[List[int]] # List of all interaction links
+    interactions: InteractionGraph # Interaction links and the reciprocal pairs among them.
+    interaction_link: List[List[int]] # List of all interaction links (interactions.links)
     interaction_len: int
+    suspicion: Optional[SuspicionEngine] # Interaction counts and suspicion scores (None unless use_suspicion and NumPy).
+    responses: ResponseTable # Prebuilt Contents to talk.
+    vote_hints: List[Tuple[Agent, Agent]] # Today's ESTIMATE WEREWOLF, REQUEST VOTE and DIVINED talks in talk order: (agent checked in candidates, agent to add).
+    vote_hints_day: int # Day of vote_hints.
         
     def __init__(self, agent_name) -> None:
         self.me = AGENT_NONE
@@ -47,18 +62,25 @@ class HyunjiVillager(AbstractPlayer):
         self.vote_talk = []
         self.voted_reports = []
         self.request_vote_talk = []
+        self.claims = ClaimStore()
         self.talk_list_head = 0
-        self.talk_list_all = []
+        self.archive = TalkArchive()
+        self.talk_list_all = self.archive.talks
         self.talk_turn = 0
         self.has_first_co = False
         self.talk_len = 0
         self.talk_exclude_vote = 0
         self.interaction_len = 0
-        self.interaction_link = [[]]
+        self.interactions = InteractionGraph()
+        self.interaction_link = self.interactions.links
+        self.suspicion = None
+        self.responses = ResponseTable(AGENT_NONE, [])
+        self.vote_hints = []
+        self.vote_hints_day = -1
     
     def is_alive(self, agent: Agent) -> bool:
         """Bool value of whether the agent is alive."""
-        return self.game_info.status_map[agent] == Status.ALIVE
+        return agent in self.game_info.alive_agents
     
     @property
     def alive_comingout_map(self) -> Dict[Agent, Role]:
@@ -78,12 +100,12 @@ class HyunjiVillager(AbstractPlayer):
 
     def get_alive(self, agent_list: List[Agent]) -> List[Agent]:
         """Return a list of alive agents contained in the given list of agents."""
-        return [a for a in agent_list if self.is_alive(a)]
+        return self.game_info.alive_agents.filter(agent_list)
 
     def get_alive_others(self, agent_list: List[Agent]) -> List[Agent]:
         """Return a list of alive agents that is contained in the given list of agents
         and is not equal to myself."""
-        return self.get_alive(self.get_others(agent_list))
+        return self.game_info.alive_agents.excluding(self.me).filter(agent_list)
     
     def vote_to_dict(self, vote_list: List[Vote]) -> Dict[int, int]:
         return {v.agent.agent_idx: v.target.agent_idx for v in vote_list}
@@ -134,19 +156,26 @@ class HyunjiVillager(AbstractPlayer):
         self.game_setting = game_setting
         self.me = game_info.me
         self.comingout_map.clear()
-        self.interaction_link.clear()
+        self.interactions.clear()
+        self.suspicion = None
+        if HyunjiVillager.use_suspicion and SuspicionEngine.available():
+            self.suspicion = SuspicionEngine(game_info.agent_list)
         self.divination_reports.clear()
         self.identification_reports.clear()
         self.vote_talk.clear()
         self.voted_reports.clear()
         self.request_vote_talk.clear()
+        self.claims.clear()
         self.talk_list_head = 0
-        self.talk_list_all = []
+        self.archive.clear()
         self.talk_turn = 0
         self.talk_len = 0
         self.interaction_len = 0
         self.talk_exclude_vote = 0
         self.has_first_co = False
+        self.responses = ResponseTable(self.me, game_info.agent_list)
+        self.vote_hints = []
+        self.vote_hints_day = -1
         
         Analyzer.game_count += 1
         Analyzer.debug_print("***************** Start of Game",  Analyzer.game_count - 1, "*****************")
@@ -167,7 +196,7 @@ class HyunjiVillager(AbstractPlayer):
         # Start of the day. Print current state
         Analyzer.debug_print("")
         Analyzer.debug_print("------- Day Start: Day", self.game_info.day, "-------")
-        Analyzer.debug_print("No. of alive agents: ", len(self.game_info.alive_agent_list))
+        Analyzer.debug_print("No. of alive agents: ", self.game_info.alive_count)
         
         # Execution report of last night
         Analyzer.debug_print("Executed last night: ", self.game_info.executed_agent)
@@ -188,14 +217,17 @@ class HyunjiVillager(AbstractPlayer):
 
     def update(self, game_info: GameInfo) -> None:
         self.game_info = game_info  # Update game information.
-        for i in range(self.talk_list_head, len(game_info.talk_list)): # Analyze talks that have not been analyzed yet.
-            tk: Talk = game_info.talk_list[i]  # The talk to be analyzed.
+        if self.vote_hints_day != game_info.day: # The talk list starts over every day.
+            self.vote_hints = []
+            self.vote_hints_day = game_info.day
+        for tk in game_info.new_talk_list: # Analyze talks that have not been analyzed yet.
             self.talk_len = self.talk_len + 1
             talker: Agent = tk.agent
             content: Content = Content.compile(tk.text)
+            self.archive.append(tk, content)
             if talker.agent_idx != content.target.agent_idx:
                 if content.operator != Operator.REQUEST and content.topic != Topic.Skip and content.topic != Topic.Over:
-                    self.interaction_link.append([talker.agent_idx, content.target.agent_idx, game_info.day, tk.idx])
+                    self.interactions.add(talker.agent_idx, content.target.agent_idx, game_info.day, tk.idx)
                     #Analyzer.debug_print(content.topic, talker.agent_idx, content.target.agent_idx)
             #if talker == self.me:  # Skip my talk.
                 #continue
@@ -204,6 +236,8 @@ class HyunjiVillager(AbstractPlayer):
                 #Analyzer.debug_print("CO: ", talker, content.role)
             elif content.topic == Topic.DIVINED:
                 self.divination_reports.append(Judge(talker, game_info.day, content.target, content.result))
+                if content.result == Species.WEREWOLF:
+                    self.claims.divined_werewolf.add(talker, content.target)
                 #Analyzer.debug_print("DIVINED: ", talker, content.target, content.result)
             elif content.topic == Topic.IDENTIFIED:
                 self.identification_reports.append(Judge(talker, game_info.day, content.target, content.result))
@@ -212,10 +246,12 @@ class HyunjiVillager(AbstractPlayer):
                 Analyzer.debug_print("ESTIMATE: ", talker, "estimate", content.target, content.role)
             elif content.topic == Topic.VOTE:
                 self.vote_talk.append(Vote(talker, game_info.day, content.target))
+                self.claims.vote.add(talker, content.target)
                 self.talk_exclude_vote = self.talk_exclude_vote - 1
                 #Analyzer.debug_print("VOTE: ", talker, "to", content.target)
             elif content.topic == Topic.VOTED: 
                 self.voted_reports.append(Vote(talker, game_info.day, content.target))
+                self.claims.voted.add(talker, content.target)
             elif content.topic == Topic.GUARDED: 
                 Analyzer.debug_print("GUARDED: ", talker, content.target)
             elif content.topic == Topic.OPERATOR and content.operator == Operator.INQUIRE:
@@ -224,51 +260,53 @@ class HyunjiVillager(AbstractPlayer):
                 for contents in content.content_list:
                     if contents.topic == Topic.VOTE:
                         self.request_vote_talk.append(Vote(talker, game_info.day, contents.target))
-                        self.interaction_link.append([talker.agent_idx, contents.target.agent_idx, game_info.day, tk.idx])
+                        self.claims.request_vote.add(talker, contents.target)
+                        self.interactions.add(talker.agent_idx, contents.target.agent_idx, game_info.day, tk.idx)
                         Analyzer.debug_print("REQUEST: ", talker, "request", content.subject, "to vote", contents.target)
+            if self.suspicion is not None:
+                self.suspicion.add_talk(game_info.day, tk.idx, talker, content)
+            # Index the talks vote() picks candidates from.
+            if content.topic == Topic.ESTIMATE and content.role == Role.WEREWOLF:
+                self.vote_hints.append((content.target, content.target))
+            elif content.topic == Topic.OPERATOR and content.operator == Operator.REQUEST:
+                for contents in content.content_list:
+                    if contents.topic == Topic.VOTE:
+                        self.vote_hints.append((content.target, contents.target))
+            elif content.topic == Topic.DIVINED:
+                self.vote_hints.append((content.target, content.target))
         self.talk_list_head = len(game_info.talk_list)  # All done.
 
     def talk(self) -> Content:
         if not self.has_first_co and self.game_info.day == 1:
             self.has_first_co = True
-            return Content(ComingoutContentBuilder(self.me, Role.VILLAGER))
+            return self.responses.comingout(Role.VILLAGER)
         self.vote_candidate = self.vote()
         rnd = random.randint(0, 2)
         # Declare which to vote for if not declare yet or the candidate is changed.
         if self.vote_candidate != AGENT_NONE and rnd == 0:
-            return Content(VoteContentBuilder(self.vote_candidate))
+            return self.responses.vote(self.vote_candidate)
         return CONTENT_SKIP
 
     def vote(self) -> Agent:
         # The list of agents that voted for me in the last turn.
-        voted_for_me: List[Agent] = [j.agent for j in self.voted_reports if j.target == self.me]
+        voted_for_me: List[Agent] = self.claims.voted.speakers(self.me)
         # The list of agents that said they would vote for me.
-        vote_talk_for_me: List[Agent] = [j.agent for j in self.vote_talk if j.target == self.me]
+        vote_talk_for_me: List[Agent] = self.claims.vote.speakers(self.me)
         # The list of agents that requested to vote for me.
-        request_vote_for_me: List[Agent] = [j.agent for j in self.request_vote_talk if j.target == self.me]
+        request_vote_for_me: List[Agent] = self.claims.request_vote.speakers(self.me)
         # The list of fake seers that reported me as a werewolf.
-        fake_seers: List[Agent] = [j.agent for j in self.divination_reports
-                                if j.target == self.me and j.result == Species.WEREWOLF]          
-        reported_wolves: List[Agent] = [j.target for j in self.divination_reports
-                                        if j.agent not in fake_seers and j.result == Species.WEREWOLF]
+        fake_seers: List[Agent] = self.claims.divined_werewolf.speakers(self.me)
+        reported_wolves: List[Agent] = self.claims.divined_werewolf.targets_except(self.claims.divined_werewolf.speaker_set(self.me))
         # Vote for one of the alive agents that were judged as werewolves by non-fake seers.
         candidates: List[Agent] = self.get_alive_others(reported_wolves)
+        candidate_set: AgentSet = AgentSet(candidates) # Same agents as candidates, for membership tests.
+        alive: AgentSet = self.game_info.alive_agents
 
-        for i in range(0, len(self.game_info.talk_list)): # Analyze talks that have not been analyzed yet.
-            tk: Talk = self.game_info.talk_list[i]  # The talk to be analyzed.
-            content: Content = Content.compile(tk.text)
-            if content.topic == Topic.ESTIMATE and content.role == Role.WEREWOLF:
-                if content.target not in candidates:
-                    if self.is_alive(content.target):
-                        candidates.append(content.target)
-            if content.topic == Topic.OPERATOR and content.operator == Operator.REQUEST:
-                for contents in content.content_list:
-                    if contents.topic == Topic.VOTE:
-                        if content.target not in candidates and self.is_alive(contents.target):
-                            candidates.append(contents.target)
-            if content.topic == Topic.DIVINED:
-                if content.target not in candidates and self.is_alive(content.target):
-                    candidates.append(content.target)
+        # Add the alive agents estimated as werewolves, requested to be voted or divined today.
+        for checked, target in self.vote_hints:
+            if checked not in candidate_set and target in alive:
+                candidates.append(target)
+                candidate_set = candidate_set.including(target)
 
         # Vote for one of the alive agents that can vote for me this turn.
         if not candidates:
@@ -293,6 +331,9 @@ class HyunjiVillager(AbstractPlayer):
             Analyzer.debug_print("Vote candidates: ", self.agent_to_index(candidates))
         return self.vote_candidate if self.vote_candidate != AGENT_NONE else self.me
 
+    def get_vote_candidate(self) -> Agent:
+        return self.vote_candidate
+
     def attack(self) -> Agent:
         raise NotImplementedError()
 
@@ -308,11 +349,7 @@ class HyunjiVillager(AbstractPlayer):
     def finish(self) -> None:
         vote_list: List[Vote] = self.game_info.vote_list
         Analyzer.debug_print('List of the final vote:', self.vote_to_dict(vote_list))
-        for speaker in self.interaction_link:
-            for target in self.interaction_link:
-                if speaker[1] == target[0] and target[1] == speaker[0]:
-                    if speaker[2] <= target[2] and speaker[3] < target[3]:
-                        self.interaction_len = self.interaction_len + 1       
+        self.interaction_len = self.interaction_len + self.interactions.count
         #Analyzer.debug_print(self.interaction_link)
         Analyzer.debug_print('Number of the interaction: ', self.interaction_len)
         #for action in self.interaction_link: